@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Compare peak memory of whole-file vs streaming passes over a stories file.
+
+For each archive size a synthetic wrapped stories file is generated and the
+cleanup-style pass (read, filter, rewrite) is run in a fresh subprocess, once
+with `load_data`/`save_data` and once with `iter_stories`/`save_data_stream`.
+The peak RSS of each subprocess is reported, so the numbers include the
+interpreter and imported libraries (a constant baseline).
+
+Usage: python3 scripts/bench_stream_memory.py [size ...]
+"""
+import importlib.util
+import json
+import os
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+
+SCRIPT = pathlib.Path(__file__).resolve()
+DEFAULT_SIZES = [5000, 10000, 20000, 40000, 80000]
+
+
+def _load_fetch_news():
+    spec = importlib.util.spec_from_file_location('fetch_news', str(SCRIPT.parent / 'fetch_news.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_story(i):
+    return {
+        'headline': f"Synthetic headline number {i} about something pleasant",
+        'link': f"https://example.com/news/{i}",
+        'mean_score': 0.5,
+        'vader_score': 0.6,
+        'textblob_score': 0.4,
+        'first_sentence': "A reasonably long first sentence to give each story a realistic size on disk. " * 2,
+        'timestamp': '2026-01-01T00:00:00Z',
+        'source': 'Example News',
+    }
+
+
+def _write_archive(path, size):
+    with open(path, 'w') as f:
+        json.dump({'last run': '2026-01-01T00:00:00Z', 'stories': [_make_story(i) for i in range(size)]}, f, indent=2)
+
+
+def _child(mode, path):
+    """Run one pass over `path` and print the peak RSS in KiB."""
+    fetch_news = _load_fetch_news()
+    keep = lambda item: not item['link'].endswith('7')
+    if mode == 'load':
+        data = fetch_news.load_data(path)
+        fetch_news.save_data([item for item in data if keep(item)], path)
+    else:
+        stories = fetch_news.iter_stories(path)
+        fetch_news.save_data_stream((item for item in stories if keep(item)), path)
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _measure(mode, size, workdir):
+    path = os.path.join(workdir, f"archive_{size}.json")
+    _write_archive(path, size)
+    out = subprocess.run([sys.executable, str(SCRIPT), '--child', mode, path],
+                         cwd=workdir, capture_output=True, text=True, check=True)
+    return int(out.stdout.split()[-1]) / 1024.0
+
+
+def main(sizes):
+    print(f"{'stories':>10} {'file MB':>9} {'load_data MB':>13} {'streaming MB':>13}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            load_rss = _measure('load', size, workdir)
+            stream_rss = _measure('stream', size, workdir)
+            _write_archive(os.path.join(workdir, 'size.json'), size)
+            file_mb = os.path.getsize(os.path.join(workdir, 'size.json')) / (1024.0 * 1024.0)
+            print(f"{size:>10} {file_mb:>9.1f} {load_rss:>13.1f} {stream_rss:>13.1f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        _child(sys.argv[2], sys.argv[3])
+    else:
+        main([int(a) for a in sys.argv[1:]] or DEFAULT_SIZES)
@@ -1,64 +1,159 @@
+import argparse
 import os
 import fetch_news
 
-def cleanup():
+# The fetch_news settings this pass applies; a change to any of them
+# triggers a full rescan.
+CLEANUP_RULES = ['BLOCK_LIST', 'URL_BLOCKLIST', 'SENTIMENT_THRESHOLD']
+
+
+def _removal_reasons(item):
+    """Return (blocked, url_blocked, below_threshold) for a stored story."""
+    headline = item.get('headline', '')
+    mean_score = item.get('mean_score', 0)
+    link = item.get('link', '')
+
+    # 1. Block list check (headline words)
+    is_blocked = any(blocked_word.lower() in headline.lower() for blocked_word in fetch_news.BLOCK_LIST)
+
+    # 2. Score threshold check
+    is_below_threshold = mean_score <= fetch_news.SENTIMENT_THRESHOLD
+
+    # 3. URL blocklist check (link substrings)
+    is_url_blocked = bool(link and any(block in link for block in getattr(fetch_news, 'URL_BLOCKLIST', [])))
+
+    return is_blocked, is_url_blocked, is_below_threshold
+
+
+def _is_url_blocked(item):
+    link = item.get('link', '')
+    return bool(link and any(block in link for block in getattr(fetch_news, 'URL_BLOCKLIST', [])))
+
+
+def _needs_check(item, full, validated):
+    """Only stories not yet validated under the current rules are checked."""
+    return full or item.get('link') not in validated
+
+
+def _print_removal(item, reasons):
+    is_blocked, is_url_blocked, _ = reasons
+    print(f"Removing: {item.get('headline', '')[:50]}... (Blocked: {is_blocked}, URL Blocked: {is_url_blocked}, Score: {item.get('mean_score', 0)})")
+
+
+def _cleanup_sqlite(fingerprint, full, validated):
+    """Apply the same rules to the SQLite store and re-export the JSON files."""
+    print(f"Loading {fetch_news.SQLITE_FILE}...")
+    conn = fetch_news.db_connect()
+    removed = []
+    kept_links = []
+    for item in fetch_news.db_iter_stories(conn):
+        if _needs_check(item, full, validated):
+            reasons = _removal_reasons(item)
+            if any(reasons):
+                _print_removal(item, reasons)
+                removed.append(item.get('link', ''))
+                continue
+        kept_links.append(item.get('link', ''))
+
+    archive_removed = []
+    if full:
+        archive_removed = [item.get('link', '') for item in fetch_news.db_iter_stories(conn, archived=True) if _is_url_blocked(item)]
+
+    if removed or archive_removed:
+        fetch_news.db_delete_stories(conn, removed + archive_removed)
+        fetch_news.db_export(conn, archive=bool(archive_removed))
+        print(f"Successfully removed {len(removed)} items.")
+        if archive_removed:
+            print(f"Removed {len(archive_removed)} items from archive.")
+        fetch_news.record_delta_removals(fetch_news.db_last_run(conn), removed)
+    else:
+        print("No items removed.")
+    fetch_news.save_validation_state('cleanup', fingerprint, kept_links)
+    conn.close()
+
+
+def cleanup(full=False):
+    """Remove stored stories that no longer pass the filters.
+
+    Only stories added since the last cleanup are checked, unless the rules
+    in CLEANUP_RULES have changed since then (or `full` is set), in which
+    case every story, and the archive, is rescanned.
+    """
+    fingerprint = fetch_news.rules_fingerprint(CLEANUP_RULES)
+    recorded, validated = fetch_news.load_validation_state('cleanup')
+    if full or recorded != fingerprint:
+        print("Filter rules changed since the last cleanup (or --full given); checking every story.")
+        full = True
+
+    if fetch_news.STORAGE_BACKEND == 'sqlite':
+        _cleanup_sqlite(fingerprint, full, validated)
+        return
+
     print(f"Loading {fetch_news.DATA_FILE}...")
     if not os.path.exists(fetch_news.DATA_FILE):
         print("Data file not found.")
         return
-        
-    # Use load_data to handle both legacy list format and wrapped format
-    data = fetch_news.load_data(fetch_news.DATA_FILE)
-        
-    initial_count = len(data)
-    cleaned_data = []
-    removed_count = 0
-    
-    for item in data:
-        headline = item.get('headline', '')
-        mean_score = item.get('mean_score', 0)
-        link = item.get('link', '')
-        
-        # 1. Block list check (headline words)
-        is_blocked = any(blocked_word.lower() in headline.lower() for blocked_word in fetch_news.BLOCK_LIST)
-        
-        # 2. Score threshold check
-        is_below_threshold = mean_score <= fetch_news.SENTIMENT_THRESHOLD
-
-        # 3. URL blocklist check (link substrings)
-        is_url_blocked = bool(link and any(block in link for block in getattr(fetch_news, 'URL_BLOCKLIST', [])))
-        
-        if is_blocked or is_below_threshold or is_url_blocked:
-            print(f"Removing: {headline[:50]}... (Blocked: {is_blocked}, URL Blocked: {is_url_blocked}, Score: {mean_score})")
-            removed_count += 1
-            continue
-            
-        cleaned_data.append(item) 
-        
+
+    # Stories are streamed rather than loaded whole, so memory stays flat as
+    # the files grow. The first pass only decides whether anything needs to
+    # go; the file is rewritten in a second pass only if it does.
+    # iter_stories handles both legacy list format and wrapped format.
+    initial_count = 0
+    checked = 0
+    removed_links = []
+    kept_links = []
+    try:
+        for item in fetch_news.iter_stories(fetch_news.DATA_FILE):
+            initial_count += 1
+            if _needs_check(item, full, validated):
+                checked += 1
+                reasons = _removal_reasons(item)
+                if any(reasons):
+                    _print_removal(item, reasons)
+                    removed_links.append(item.get('link', ''))
+                    continue
+            kept_links.append(item.get('link', ''))
+    except ValueError as e:
+        print(f"Could not read {fetch_news.DATA_FILE}: {e}")
+        return
+    print(f"Checked {checked} of {initial_count} stories.")
+
+    removed_count = len(removed_links)
     if removed_count > 0:
-        # Use save_data to preserve wrapped format if present
-        fetch_news.save_data(cleaned_data, fetch_news.DATA_FILE)
+        # save_data_stream preserves wrapped format if present
+        kept = (item for item in fetch_news.iter_stories(fetch_news.DATA_FILE)
+                if not (_needs_check(item, full, validated) and any(_removal_reasons(item))))
+        fetch_news.save_data_stream(kept, fetch_news.DATA_FILE)
         print(f"Successfully removed {removed_count} out of {initial_count} items.")
 
-        # Additionally, clean the archive file of any URL-blocked links
-        if hasattr(fetch_news, 'ARCHIVE_FILE') and os.path.exists(fetch_news.ARCHIVE_FILE):
-            # Use load_data to handle both formats
-            archive = fetch_news.load_data(fetch_news.ARCHIVE_FILE)
-            archive_initial = len(archive)
-            new_archive = []
-            removed_archive = 0
-            for item in archive:
-                link = item.get('link', '')
-                if link and any(block in link for block in getattr(fetch_news, 'URL_BLOCKLIST', [])):
-                    removed_archive += 1
-                    continue
-                new_archive.append(item)
-            if removed_archive > 0:
-                # Use save_data to preserve wrapped format if present
-                fetch_news.save_data(new_archive, fetch_news.ARCHIVE_FILE)
-                print(f"Removed {removed_archive} items from archive ({fetch_news.ARCHIVE_FILE}).")
+        # Let delta-following clients know these stories are gone too
+        fetch_news.record_delta_removals(fetch_news.load_last_run(fetch_news.DATA_FILE), removed_links)
     else:
         print("No items removed.")
 
+    # Stories only reach the archive after passing these rules, so it only
+    # needs rescanning when the rules change. Clean it of any URL-blocked links.
+    if full and hasattr(fetch_news, 'ARCHIVE_FILE') and os.path.exists(fetch_news.ARCHIVE_FILE):
+        try:
+            removed_archive = sum(1 for item in fetch_news.iter_stories(fetch_news.ARCHIVE_FILE) if _is_url_blocked(item))
+        except ValueError as e:
+            print(f"Could not read {fetch_news.ARCHIVE_FILE}: {e}")
+            return
+        if removed_archive > 0:
+            kept = (item for item in fetch_news.iter_stories(fetch_news.ARCHIVE_FILE) if not _is_url_blocked(item))
+            fetch_news.save_data_stream(kept, fetch_news.ARCHIVE_FILE)
+            print(f"Removed {removed_archive} items from archive ({fetch_news.ARCHIVE_FILE}).")
+
+    fetch_news.save_validation_state('cleanup', fingerprint, kept_links)
+
 if __name__ == "__main__":
-    cleanup()
+    parser = argparse.ArgumentParser(description="Remove stored stories that no longer pass the filters.")
+    parser.add_argument('--full', action='store_true', help="check every story even if the rules are unchanged")
+    args = parser.parse_args()
+    if fetch_news.profiling_requested():
+        fetch_news.enable_profiling()
+    try:
+        with fetch_news.profile_stage('cleanup', snapshot=True):
+            cleanup(full=args.full)
+    finally:
+        fetch_news.write_profile_report('cleanup')
@@ -1,6 +1,6 @@
 import feedparser
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from textblob import TextBlob
+from textblob.en.sentiments import PatternAnalyzer
 import requests
 from bs4 import BeautifulSoup
 import json
@@ -11,6 +11,20 @@ from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 import bisect
 import re
+import argparse
+import calendar
+import signal
+import subprocess
+import sys
+import statistics
+import sqlite3
+import hashlib
+import contextlib
+import cProfile
+import io
+import pstats
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 
 # Configuration
 RSS_FEEDS = [
@@ -137,6 +151,82 @@ URL_BLOCKLIST = [
     'bbc.com/sport',
     'theguardian.com/thefilter-us',
 ]
+# CSS selectors for the article-body paragraphs of known publishers, keyed by
+# an identifying substring of the article URL (the same hosts as SOURCE_MAP).
+# get_first_sentence tries these first and falls back to scanning every <p>
+# on the page. Add more entries here as new feeds are added.
+ARTICLE_EXTRACTORS = {
+    'bbc.co.uk': '[data-component="text-block"] p',
+    'bbc.com': '[data-component="text-block"] p',
+    'theguardian.com': '#maincontent p, [data-gu-name="body"] p',
+    'npr.org': '#storytext > p',
+    'arstechnica.com': '.post-content p',
+    'abc.net.au': '#body p, article p',
+    'sbs.com.au': 'article p',
+}
+
+# Paragraphs containing any of these are never used as a first sentence
+IGNORED_PHRASES = [
+    "Copyright", 
+    "Find any issues using dark mode", 
+    "Use BBC", 
+    "terms of use",
+    "privacy policy"
+]
+
+# Minimum quality score (0-1, see `score_sentence`) a sentence taken from the
+# feed entry itself (content:encoded or summary) must reach for the article
+# fetch to be skipped, keyed by canonical source name. Sources not listed
+# here, or set to None, always fetch the article.
+FEED_SUMMARY_MIN_SCORE = {
+    'The Guardian': 0.8,
+    'Ars Technica': 0.8,
+    'NPR News': 0.8,
+}
+
+# Boilerplate that feeds append to their summaries
+FEED_SUMMARY_BOILERPLATE = [
+    "Continue reading",
+    "Read more",
+    "appeared first on",
+]
+
+# Daemon mode (`--daemon`): per-feed poll intervals are learned from publish
+# times and kept within these bounds (seconds).
+DAEMON_DEFAULT_INTERVAL = 30 * 60
+DAEMON_MIN_INTERVAL = 10 * 60
+DAEMON_MAX_INTERVAL = 6 * 60 * 60
+DAEMON_POLL_SAMPLE = 10  # newest entries used to estimate a feed's cadence
+DAEMON_FLUSH_INTERVAL = 15 * 60
+# The rest of the scheduled pipeline, run in order after every daemon flush
+# so the RSS feeds and partitions stay current and the cleanup rules apply.
+DAEMON_FLUSH_SCRIPTS = ['cleanup_news.py', 'normalize_sources.py', 'generate_rss.py']
+
+# Run-level time budget for a one-shot run (seconds, 0 disables it). Feeds are
+# fetched in order of historical yield and reliability. Article scraping is
+# skipped once less than SCRAPE_RESERVE seconds remain, and the remaining
+# feeds once less than SAVE_RESERVE remain, so the run always ends with a save.
+RUN_TIME_BUDGET = 300
+SCRAPE_RESERVE = 60
+SAVE_RESERVE = 20
+REQUEST_TIMEOUT = 10
+# Download limits. Bodies are streamed and abandoned once they pass the cap
+# for their kind, and responses whose Content-Type we cannot parse are
+# rejected before the body is read. A missing Content-Type is allowed.
+# Content types are exact MIME types, or a structured-syntax suffix such as
+# '+xml' (application/rss+xml, application/atom+xml, ...).
+MAX_FEED_BYTES = 5 * 1024 * 1024
+MAX_ARTICLE_BYTES = 2 * 1024 * 1024
+FEED_CONTENT_TYPES = ['application/xml', 'text/xml', '+xml', 'text/html']
+ARTICLE_CONTENT_TYPES = ['text/html', 'application/xhtml+xml']
+# Headline scoring. The candidate headlines from all feeds in a run are scored
+# as one batch, split into chunks across a pool of SCORE_WORKERS processes
+# (default: one per CPU). Smaller batches, or a single CPU, are scored in
+# this process because starting the pool would cost more than it saves.
+SCORE_WORKERS = None
+SCORE_POOL_MIN_HEADLINES = 500
+SCORE_CHUNK_SIZE = 100
+
 MAX_STORIES = 250
 # Use `docs/` as the storage directory
 DATA_DIR = "docs"
@@ -145,6 +235,28 @@ ARCHIVE_FILE = os.path.join(DATA_DIR, "old_news.json")
 LOG_FILE = os.path.join(DATA_DIR, "fetch.log")
 METRICS_FILE = os.path.join(DATA_DIR, "metrics.json")
 SENTENCE_CACHE_FILE = os.path.join(DATA_DIR, "sentence_cache.json")
+# Per-run delta files (stories added/archived since the previous run) and a
+# rolling index of them, so clients can catch up without the full snapshot.
+DELTA_DIR = os.path.join(DATA_DIR, "deltas")
+DELTA_INDEX_FILE = os.path.join(DELTA_DIR, "index.json")
+MAX_DELTAS = 56  # one week of runs at the 3-hourly schedule
+# Which stories the cleanup and normalization passes have already checked,
+# and under which fingerprint of the rules they apply (see rules_fingerprint).
+VALIDATION_STATE_FILE = os.path.join(DATA_DIR, "validation_state.json")
+# Per-source and per-day slices of the story files, written by generate_rss.py,
+# with a manifest listing each partition's file, story count, size and hash.
+PARTITION_DIR = os.path.join(DATA_DIR, "partitions")
+PARTITION_MANIFEST_FILE = os.path.join(PARTITION_DIR, "manifest.json")
+# Profiling (--profile, or RAMAH_PROFILE=1 for every script in the pipeline):
+# per-stage CPU profiles and memory reports are written to PROFILE_DIR.
+PROFILE_DIR = os.path.join(DATA_DIR, "profile")
+PROFILE_TOP_N = 10
+# Storage backend. 'json' (default) keeps the files above as the source of
+# truth. 'sqlite' keeps stories, the sentence cache and metrics in an indexed
+# SQLite database and exports the JSON files from it after every run. Select
+# it with the RAMAH_STORAGE environment variable.
+STORAGE_BACKEND = os.environ.get('RAMAH_STORAGE', 'json')
+SQLITE_FILE = os.path.join(DATA_DIR, "ramah.db")
 
 # Setup Logging
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -157,30 +269,326 @@ logging.basicConfig(
     ]
 )
 
-def fetch_feed_with_retry(feed_url, max_retries=3, initial_delay=1):
-    """Fetch RSS feed with exponential backoff retry logic."""
+_profile_stages = None  # stage name -> measurements, while profiling is enabled
+_active_stage = None
+
+
+def profiling_requested(flag=False):
+    """True if `flag` is set or RAMAH_PROFILE=1 is in the environment."""
+    return flag or os.environ.get('RAMAH_PROFILE') == '1'
+
+
+def enable_profiling():
+    """Start collecting per-stage profiles (see `profile_stage`)."""
+    global _profile_stages
+    _profile_stages = {}
+    tracemalloc.start()
+
+
+@contextlib.contextmanager
+def profile_stage(name, snapshot=False):
+    """Attribute the enclosed work to pipeline stage `name` when profiling.
+
+    Usable as a context manager or a decorator. Each stage accumulates its
+    own cProfile profile, call count, wall time and largest tracemalloc peak
+    above the memory in use on entry. With `snapshot`, a tracemalloc snapshot
+    is also kept from the end of the stage. Stages do not nest: work inside
+    an active stage is attributed to that stage. Costs almost nothing when
+    profiling is off.
+    """
+    global _active_stage
+    if _profile_stages is None or _active_stage is not None:
+        yield
+        return
+
+    record = _profile_stages.setdefault(name, {
+        'profile': cProfile.Profile(), 'calls': 0, 'seconds': 0.0, 'peak_bytes': 0, 'snapshot': None,
+    })
+    _active_stage = name
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    record['profile'].enable()
+    try:
+        yield
+    finally:
+        record['profile'].disable()
+        record['seconds'] += time.perf_counter() - started
+        record['calls'] += 1
+        record['peak_bytes'] = max(record['peak_bytes'], tracemalloc.get_traced_memory()[1] - base)
+        if snapshot:
+            record['snapshot'] = tracemalloc.take_snapshot()
+        _active_stage = None
+
+
+def write_profile_report(label):
+    """Write the collected stage profiles to PROFILE_DIR and log a summary.
+
+    For each stage this writes `<label>-<stage>.prof` (loadable with pstats
+    or snakeviz). `<label>-summary.txt` gets the top PROFILE_TOP_N functions
+    per stage and, for snapshot stages, the largest allocations. Does
+    nothing unless profiling was enabled.
+    """
+    if not _profile_stages:
+        return
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+
+    report = []
+    for name, record in sorted(_profile_stages.items(), key=lambda item: -item[1]['seconds']):
+        record['profile'].dump_stats(os.path.join(PROFILE_DIR, f"{label}-{name}.prof"))
+        stream = io.StringIO()
+        stats = pstats.Stats(record['profile'], stream=stream)
+        stats.sort_stats('cumulative').print_stats(PROFILE_TOP_N)
+
+        heading = (f"{name}: {record['calls']} calls, {record['seconds']:.2f}s, "
+                   f"peak +{record['peak_bytes'] / (1024 * 1024):.1f} MiB")
+        hottest = sorted(stats.stats.items(), key=lambda item: -item[1][2])[:3]
+        logging.info(f"Profile {heading} | top: " + ", ".join(
+            f"{func[2]} ({timing[2]:.2f}s)" for func, timing in hottest))
+
+        report.append(f"=== {heading} ===")
+        report.append(stream.getvalue())
+        if record['snapshot'] is not None:
+            report.append(f"Largest allocations held at the end of {name}:")
+            report.extend(str(stat) for stat in record['snapshot'].statistics('lineno')[:PROFILE_TOP_N])
+            report.append('')
+
+    summary_file = os.path.join(PROFILE_DIR, f"{label}-summary.txt")
+    with open(summary_file, 'w') as f:
+        f.write('\n'.join(report))
+    logging.info(f"Profile reports written to {PROFILE_DIR} ({summary_file})")
+
+
+_http_session = None
+
+
+def _session():
+    """Return the shared requests session, so connections are reused."""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+    return _http_session
+
+
+def _request_timeout(deadline):
+    """Per-request timeout: REQUEST_TIMEOUT, shortened to fit `deadline`."""
+    if deadline is None:
+        return REQUEST_TIMEOUT
+    return max(1, min(REQUEST_TIMEOUT, deadline - time.time()))
+
+
+class DownloadRejected(Exception):
+    """A response was refused by `_download`; `reason` is 'oversized' or 'rejected'."""
+
+    def __init__(self, reason, message):
+        super().__init__(message)
+        self.reason = reason
+
+
+def _download(url, headers, max_bytes, content_types, deadline=None):
+    """GET `url` and return the body, read in chunks and capped at `max_bytes`.
+
+    Raises DownloadRejected if the Content-Type's MIME type is not one of
+    `content_types` (or does not end in one of its '+suffix' entries), or if
+    the declared or actual size exceeds `max_bytes`. In both cases the rest
+    of the body is never read.
+    """
+    response = _session().get(url, headers=headers, timeout=_request_timeout(deadline), stream=True)
+    try:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and content_type not in content_types and not any(
+                allowed.startswith('+') and content_type.endswith(allowed) for allowed in content_types):
+            raise DownloadRejected('rejected', f"unexpected content type {content_type}")
+        length = response.headers.get('Content-Length', '')
+        if length.isdigit() and int(length) > max_bytes:
+            raise DownloadRejected('oversized', f"{length} bytes is over the {max_bytes} byte limit")
+
+        body = bytearray()
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            body += chunk
+            if len(body) > max_bytes:
+                raise DownloadRejected('oversized', f"body is over the {max_bytes} byte limit")
+        return bytes(body)
+    finally:
+        response.close()
+
+
+def _count_rejection(metrics, kind, error):
+    """Count a DownloadRejected as e.g. metrics['feeds_oversized']."""
+    if metrics is not None:
+        key = f"{kind}s_{error.reason}"
+        metrics[key] = metrics.get(key, 0) + 1
+
+
+def fetch_feed_with_retry(feed_url, max_retries=3, initial_delay=1, deadline=None, metrics=None):
+    """Fetch RSS feed with exponential backoff retry logic.
+
+    If `deadline` (an epoch time) is given, request timeouts are shortened to
+    fit it and no retry is attempted that would start after it. Feeds over
+    MAX_FEED_BYTES or of the wrong content type are not retried; they are
+    counted in `metrics` (feeds_oversized / feeds_rejected) if it is given.
+    """
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
     
     for attempt in range(max_retries):
         try:
-            response = requests.get(feed_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            return feedparser.parse(response.content)
+            with profile_stage('fetch'):
+                content = _download(feed_url, headers, MAX_FEED_BYTES, FEED_CONTENT_TYPES, deadline)
+            with profile_stage('parse'):
+                return feedparser.parse(content)
+        except DownloadRejected as e:
+            logging.error(f"Skipping feed {feed_url}: {e}")
+            _count_rejection(metrics, 'feed', e)
+            return None
         except Exception as e:
-            if attempt == max_retries - 1:
-                logging.error(f"Failed to fetch {feed_url} after {max_retries} attempts: {e}")
+            delay = initial_delay * (2 ** attempt)
+            out_of_time = deadline is not None and time.time() + delay >= deadline
+            if attempt == max_retries - 1 or out_of_time:
+                logging.error(f"Failed to fetch {feed_url} after {attempt + 1} attempts: {e}")
                 return None
             
-            delay = initial_delay * (2 ** attempt)
             logging.warning(f"Attempt {attempt + 1} failed for {feed_url}. Retrying in {delay}s...")
             time.sleep(delay)
     
     return None
 
-def save_run_metrics(metrics):
-    """Append run metrics to a rolling log."""
+_file_digests = {}  # filename -> ((mtime_ns, size), sha256) for files read or written by this process
+
+
+def _stat_key(filename):
+    st = os.stat(filename)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _file_digest(filename):
+    """sha256 of `filename`, reusing the last result while the file is unchanged."""
+    key = _stat_key(filename)
+    cached = _file_digests.get(filename)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+            digest.update(block)
+    _file_digests[filename] = (key, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def write_atomic(filename, content):
+    """Write `content` to `filename` atomically, skipping no-op rewrites.
+
+    `content` is a string or an iterable of strings, consumed as it is written
+    so large outputs can be streamed. Everything goes to `filename.tmp`, which
+    is renamed over `filename` only once complete, so readers never see a
+    partial file and a failure leaves the old one in place. If the new bytes
+    hash the same as the file on disk, the temporary file is discarded and
+    `filename` is left untouched. Returns True if the file was replaced.
+    """
+    if isinstance(content, str):
+        content = (content,)
+    tmp = filename + '.tmp'
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(tmp, 'wb') as f:
+            for chunk in content:
+                data = chunk.encode('utf-8')
+                f.write(data)
+                digest.update(data)
+                size += len(data)
+        digest = digest.hexdigest()
+        if os.path.exists(filename) and os.path.getsize(filename) == size and _file_digest(filename) == digest:
+            os.remove(tmp)
+            return False
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    _file_digests[filename] = (_stat_key(filename), digest)
+    return True
+
+
+def load_run_metrics():
+    """Return the rolling metrics history (oldest first), or [] if unavailable."""
+    if os.path.exists(METRICS_FILE):
+        try:
+            with open(METRICS_FILE, 'r') as f:
+                history = json.load(f)
+            if isinstance(history, list):
+                return history
+        except Exception:
+            logging.warning(f"Failed to load {METRICS_FILE}; feeds keep their configured order.")
+    return []
+
+
+def prioritize_feeds(feeds, history):
+    """Order `feeds` by expected accepted stories per run, best first.
+
+    Yield comes from `stories_by_feed` in the metrics history, averaged over
+    the runs in which the feed was fetched successfully. Feeds with no such
+    run fall back to `stories_by_source` split evenly across that source's
+    feeds. Yield is weighted by each feed's success rate from
+    `failed_feeds`. Runs that skipped a feed (`feeds_skipped`) count towards
+    neither. Ties keep the configured order.
+    """
+    runs = len(history)
+    by_source = {}
+    by_feed = {}
+    fetched_runs = {}
+    failures = {}
+    attempts = {}
+    for run in history:
+        for source, count in run.get('stories_by_source', {}).items():
+            by_source[source] = by_source.get(source, 0) + count
+        skipped = set(run.get('feeds_skipped', []))
+        failed = set(run.get('failed_feeds', []))
+        for url in feeds:
+            if url in skipped:
+                continue
+            if 'failed_feeds' in run:
+                attempts[url] = attempts.get(url, 0) + 1
+                if url in failed:
+                    failures[url] = failures.get(url, 0) + 1
+            if 'stories_by_feed' in run and url not in failed:
+                fetched_runs[url] = fetched_runs.get(url, 0) + 1
+                by_feed[url] = by_feed.get(url, 0) + run['stories_by_feed'].get(url, 0)
+
+    feeds_per_source = {}
+    for url in feeds:
+        source = canonical_source(url)
+        feeds_per_source[source] = feeds_per_source.get(source, 0) + 1
+
+    def expected_yield(url):
+        if fetched_runs.get(url):
+            stories = by_feed[url] / fetched_runs[url]
+        elif runs:
+            source = canonical_source(url)
+            stories = by_source.get(source, 0) / runs / feeds_per_source[source]
+        else:
+            stories = 0
+        reliability = 1 - failures.get(url, 0) / attempts[url] if attempts.get(url) else 1
+        return stories * reliability
+
+    return sorted(feeds, key=lambda url: -expected_yield(url))
+
+
+def save_run_metrics(metrics, conn=None):
+    """Append run metrics to a rolling log.
+
+    With a SQLite connection the metrics are stored there and `METRICS_FILE`
+    is exported from the newest 100 rows.
+    """
+    if conn is not None:
+        with conn:
+            conn.execute("INSERT INTO metrics (data) VALUES (?)", (json.dumps(metrics),))
+        rows = conn.execute("SELECT data FROM (SELECT id, data FROM metrics ORDER BY id DESC LIMIT 100) ORDER BY id")
+        write_atomic(METRICS_FILE, json.dumps([json.loads(data) for (data,) in rows], indent=2))
+        return
+
     history = []
     if os.path.exists(METRICS_FILE):
         try:
@@ -193,8 +601,7 @@ def save_run_metrics(metrics):
     # Keep only last 100 runs
     history = history[-100:]
     
-    with open(METRICS_FILE, 'w') as f:
-        json.dump(history, f, indent=2)
+    write_atomic(METRICS_FILE, json.dumps(history, indent=2))
 
 def load_sentence_cache():
     """Load cached first sentences keyed by article URL."""
@@ -209,56 +616,196 @@ def load_sentence_cache():
 
 def save_sentence_cache(cache):
     """Save sentence cache to disk."""
+    if isinstance(cache, DbSentenceCache):
+        with cache.conn:
+            cache.conn.executemany("INSERT OR REPLACE INTO sentence_cache (link, sentence) VALUES (?, ?)",
+                                   cache.pending.items())
+        cache.pending = {}
+        return
     try:
-        with open(SENTENCE_CACHE_FILE, 'w') as f:
-            json.dump(cache, f, indent=2)
+        write_atomic(SENTENCE_CACHE_FILE, json.dumps(cache, indent=2))
     except Exception as e:
         logging.error(f"Failed to save sentence cache: {e}")
 
-def get_first_sentence(url):
+def _first_sentence_from_paragraphs(paragraphs):
+    """Apply the generic first-sentence rule to a sequence of <p> tags."""
+    for p in paragraphs:
+        text = p.get_text().strip()
+        
+        # Skip if any ignored phrase is in the text
+        if any(phrase in text for phrase in IGNORED_PHRASES):
+            continue
+
+        # Simple filter to avoid menu items, copyright notices, etc.
+        # Increased length check slightly and check for end punctuation
+        if len(text) > 60 and text[-1] in ['.', '!', '?']:
+            # Split by dot to get the first sentence (naively)
+            return text.split('. ')[0].rstrip('.') + '.'
+    return None
+
+
+def _article_selector(url):
+    """Return the ARTICLE_EXTRACTORS selector matching `url`, or None."""
+    for key, selector in ARTICLE_EXTRACTORS.items():
+        if key in (url or ''):
+            return selector
+    return None
+
+
+def extract_first_sentence(html, url):
+    """Extract the first sentence from an article page.
+
+    Uses the publisher's article-body selector from `ARTICLE_EXTRACTORS` when
+    one matches `url`, and falls back to scanning every <p> on the page.
+    Returns a tuple (sentence or None, True if the publisher extractor found it).
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+
+    selector = _article_selector(url)
+    if selector:
+        sentence = _first_sentence_from_paragraphs(soup.select(selector))
+        if sentence:
+            return sentence, True
+
+    # Generic heuristic for finding article text based on common structures
+    return _first_sentence_from_paragraphs(soup.find_all('p')), False
+
+
+def _record_extraction(stats, url, sentence, via_extractor, seconds=None):
+    """Accumulate per-publisher extraction counters into `stats`.
+
+    `seconds` is the time spent parsing the page, or None if the page could
+    not be downloaded, which counts as a failed attempt but not towards the
+    average extraction time.
+    """
+    if stats is None:
+        return
+    publisher = canonical_source(url, None, url)
+    entry = stats.setdefault(publisher, {'attempts': 0, 'successes': 0, 'via_extractor': 0,
+                                         'fetch_failures': 0, 'extract_seconds': 0.0})
+    entry['attempts'] += 1
+    if seconds is None:
+        entry['fetch_failures'] += 1
+    else:
+        entry['extract_seconds'] += seconds
+    if sentence:
+        entry['successes'] += 1
+        if via_extractor:
+            entry['via_extractor'] += 1
+
+
+def summarize_extraction_stats(stats):
+    """Turn raw extraction counters into the per-publisher metrics entry."""
+    summary = {}
+    for publisher, entry in sorted(stats.items()):
+        attempts = entry['attempts']
+        parsed = attempts - entry['fetch_failures']
+        summary[publisher] = {
+            'attempts': attempts,
+            'successes': entry['successes'],
+            'via_extractor': entry['via_extractor'],
+            'fetch_failures': entry['fetch_failures'],
+            'success_rate': round(entry['successes'] / attempts, 2) if attempts else 0,
+            # Averaged over the pages actually parsed
+            'avg_extract_seconds': round(entry['extract_seconds'] / parsed, 3) if parsed else 0,
+        }
+    return summary
+
+
+def score_sentence(sentence, headline=None):
+    """Score how usable `sentence` is as a story's first sentence, from 0 to 1.
+
+    Rewards a sentence-like length, a capitalised start and closing
+    punctuation, and penalises truncation. Boilerplate (IGNORED_PHRASES,
+    FEED_SUMMARY_BOILERPLATE) and a sentence that just repeats the headline
+    score 0, so they never pass a FEED_SUMMARY_MIN_SCORE threshold.
+    """
+    if not sentence:
+        return 0.0
+    text = sentence.strip()
+    if any(phrase in text for phrase in IGNORED_PHRASES + FEED_SUMMARY_BOILERPLATE):
+        return 0.0
+    if headline and text.rstrip('.!?').lower() == headline.strip().rstrip('.!?').lower():
+        return 0.0
+    score = 0.0
+    if 60 < len(text) <= 300:
+        score += 0.4
+    elif 30 < len(text) <= 60:
+        score += 0.2
+    if text[-1] in ['.', '!', '?'] and not text.endswith('...'):
+        score += 0.2
+    if text[0].isupper() or text[0].isdigit() or text[0] in '"\'\u201c\u2018':
+        score += 0.2
+    if '\u2026' not in text:
+        score += 0.2
+    return round(score, 2)
+
+
+@profile_stage('scrape')
+def sentence_from_entry(entry):
+    """Extract and score a first sentence from the feed entry itself.
+
+    Prefers the full text in `content:encoded` and falls back to the summary
+    or description. Returns a tuple (sentence or None, score).
+    """
+    candidates = [c.get('value', '') for c in entry.get('content', []) or []]
+    candidates.append(entry.get('summary') or entry.get('description', ''))
+
+    best, best_score = None, 0.0
+    for html in candidates:
+        if not html:
+            continue
+        soup = BeautifulSoup(html, 'html.parser')
+        sentence = _first_sentence_from_paragraphs(soup.find_all('p'))
+        if not sentence:
+            text = soup.get_text(' ').strip()
+            if text:
+                sentence = text.split('. ')[0].rstrip('.') + '.'
+                # Same rule as for <p> tags: never fall back to a notice
+                if any(phrase in sentence for phrase in IGNORED_PHRASES):
+                    sentence = None
+        score = score_sentence(sentence, entry.get('title'))
+        if score > best_score:
+            best, best_score = sentence, score
+    return best, best_score
+
+
+@profile_stage('scrape')
+def get_first_sentence(url, stats=None, deadline=None, metrics=None):
     """
     Fetches the article content and attempts to extract the first sentence.
     Falls back to None if extraction fails.
+
+    If `stats` is a dict, per-publisher attempts, successes and extraction
+    time are accumulated into it (see `summarize_extraction_stats`). The
+    request timeout is shortened to fit `deadline` if one is given. Pages over
+    MAX_ARTICLE_BYTES or not HTML are skipped and counted in `metrics`
+    (articles_oversized / articles_rejected).
     """
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Heuristics for finding article text based on common structures
-        paragraphs = soup.find_all('p')
-        
-        ignored_phrases = [
-            "Copyright", 
-            "Find any issues using dark mode", 
-            "Use BBC", 
-            "terms of use",
-            "privacy policy"
-        ]
-
-        for p in paragraphs:
-            text = p.get_text().strip()
-            
-            # Skip if any ignored phrase is in the text
-            if any(phrase in text for phrase in ignored_phrases):
-                continue
-
-            # Simple filter to avoid menu items, copyright notices, etc.
-            # Increased length check slightly and check for end punctuation
-            if len(text) > 60 and text[-1] in ['.', '!', '?']:
-                # Split by dot to get the first sentence (naively)
-                first_sentence = text.split('. ')[0].rstrip('.') + '.'
-                return first_sentence
-                
+        content = _download(url, headers, MAX_ARTICLE_BYTES, ARTICLE_CONTENT_TYPES, deadline)
+    except DownloadRejected as e:
+        logging.warning(f"Skipping content for {url}: {e}")
+        _count_rejection(metrics, 'article', e)
+        _record_extraction(stats, url, None, False)
+        return None
     except Exception as e:
         logging.warning(f"Failed to fetch content for {url}: {e}")
+        _record_extraction(stats, url, None, False)
         return None
-    
-    return None
+
+    started = time.perf_counter()
+    try:
+        first_sentence, via_extractor = extract_first_sentence(content, url)
+    except Exception as e:
+        logging.warning(f"Failed to extract content for {url}: {e}")
+        first_sentence, via_extractor = None, False
+    _record_extraction(stats, url, first_sentence, via_extractor, time.perf_counter() - started)
+
+    return first_sentence
 
 def _current_timestamp_str():
     # Use UTC in the same format used elsewhere in this project.
@@ -295,6 +842,359 @@ def load_data(filename):
     return []
 
 
+# Read size used by the streaming story reader.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+def _iter_story_events(filename, chunk_size=STREAM_CHUNK_SIZE):
+    """Incrementally parse a stories file without loading it whole.
+
+    Yields ``('meta', key, value)`` for top-level keys of the wrapped format
+    other than "stories", and ``('story', item)`` for each element of the
+    stories list (wrapped format) or of the top-level list (legacy format).
+    Only one story is held in memory at a time. Raises ValueError if the
+    file is not valid JSON in either format.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, 'r') as f:
+        buf = ''
+        pos = 0
+        eof = False
+
+        def fill():
+            nonlocal buf, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_ws():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buf) or not fill():
+                    return
+
+        def peek():
+            skip_ws()
+            if pos >= len(buf):
+                raise ValueError(f"Unexpected end of file in {filename}")
+            return buf[pos]
+
+        def expect(char):
+            nonlocal pos
+            if peek() != char:
+                raise ValueError(f"Expected '{char}' at offset {pos} in {filename}")
+            pos += 1
+
+        def value():
+            # Decode the next JSON value, reading more of the file until the
+            # value is complete. A value that ends exactly at the end of the
+            # buffer may be a truncated number, so read on before accepting it.
+            nonlocal pos
+            peek()
+            while True:
+                try:
+                    obj, end = decoder.raw_decode(buf, pos)
+                    if end < len(buf) or eof:
+                        pos = end
+                        return obj
+                except json.JSONDecodeError:
+                    if eof:
+                        raise ValueError(f"Invalid JSON in {filename}")
+                fill()
+
+        def stories():
+            nonlocal pos
+            expect('[')
+            if peek() == ']':
+                pos += 1
+                return
+            while True:
+                yield ('story', value())
+                if peek() == ',':
+                    pos += 1
+                    continue
+                expect(']')
+                return
+
+        first = peek()
+        if first == '[':
+            yield from stories()
+        elif first == '{':
+            pos += 1
+            if peek() == '}':
+                pos += 1
+                return
+            while True:
+                key = value()
+                expect(':')
+                if key == 'stories' and peek() == '[':
+                    yield from stories()
+                else:
+                    yield ('meta', key, value())
+                if peek() == ',':
+                    pos += 1
+                    continue
+                expect('}')
+                return
+        else:
+            raise ValueError(f"Unexpected JSON structure in {filename}")
+
+
+def iter_stories(filename, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield stories from `filename` one at a time.
+
+    Streaming counterpart of `load_data` for archive-sized files: memory use
+    stays flat however many stories the file holds. Accepts both the legacy
+    list format and the wrapped format. Yields nothing if the file does not
+    exist and raises ValueError if it is malformed.
+    """
+    if not os.path.exists(filename):
+        return
+    for event in _iter_story_events(filename, chunk_size):
+        if event[0] == 'story':
+            yield event[1]
+
+
+def _peek_format(filename):
+    """Return ``(wrapped, last_run)`` for an existing stories file.
+
+    Stops reading as soon as 'last run' is found, which for files written by
+    this script is within the first few bytes.
+    """
+    wrapped = False
+    try:
+        with open(filename, 'r') as f:
+            head = f.read(1024).lstrip(_WHITESPACE)
+        wrapped = head.startswith('{')
+        if not wrapped:
+            return False, None
+        for event in _iter_story_events(filename):
+            if event[0] == 'meta' and event[1] == 'last run':
+                return True, event[2]
+    except (OSError, ValueError):
+        pass
+    return wrapped, None
+
+
+_file_formats = {}  # filename -> ((mtime_ns, size), (wrapped, last_run))
+
+
+def _stored_format(filename):
+    """Return `_peek_format(filename)`, or (False, None) if there is no file.
+
+    Results are cached until the file changes, and saves record the format
+    they wrote, so repeated saves of the same file (as in daemon mode) do not
+    re-read it.
+    """
+    if not os.path.exists(filename):
+        return False, None
+    key = _stat_key(filename)
+    cached = _file_formats.get(filename)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    fmt = _peek_format(filename)
+    _file_formats[filename] = (key, fmt)
+    return fmt
+
+
+def _remember_format(filename, wrapped, last_run):
+    _file_formats[filename] = (_stat_key(filename), (wrapped, last_run if wrapped else None))
+
+
+def load_last_run(filename):
+    """Return the 'last run' timestamp stored in `filename`, or None.
+
+    Legacy list-format files carry no timestamp and also return None.
+    """
+    return _stored_format(filename)[1]
+
+
+def _dump_story(story, indent):
+    """Serialise one story exactly as `json.dump(..., indent=2)` would nest it."""
+    return json.dumps(story, indent=2).replace('\n', '\n' + indent)
+
+
+def save_data_stream(stories, filename, last_run=None):
+    """Stream `stories` (any iterable) to `filename` and return the count.
+
+    Same format rules as `save_data`, and byte-for-byte the same output, but
+    stories are serialised one at a time so the list never needs to exist in
+    memory. Output goes through `write_atomic`, which replaces `filename` only
+    once the iterable is exhausted, so `stories` may itself be reading
+    `filename` via `iter_stories`.
+    """
+    existing_wrapped, existing_last_run = _stored_format(filename)
+
+    write_wrapped = last_run is not None or existing_wrapped
+    if write_wrapped:
+        lr = last_run if last_run is not None else existing_last_run
+        if not lr:
+            lr = _current_timestamp_str()
+        head = '{\n  "last run": ' + json.dumps(lr) + ',\n  "stories": ['
+        tail = '\n  ]\n}'
+        indent = '    '
+        empty = '{\n  "last run": ' + json.dumps(lr) + ',\n  "stories": []\n}'
+    else:
+        head = '['
+        tail = '\n]'
+        indent = '  '
+        empty = '[]'
+
+    count = 0
+
+    def chunks():
+        nonlocal count
+        for story in stories:
+            yield (head if count == 0 else ',') + '\n' + indent + _dump_story(story, indent)
+            count += 1
+        yield tail if count else empty
+
+    write_atomic(filename, chunks())
+    _remember_format(filename, write_wrapped, lr if write_wrapped else None)
+    return count
+
+
+def rules_fingerprint(names):
+    """Return a short hash of the module-level rule sets named in `names`.
+
+    For example ``rules_fingerprint(['BLOCK_LIST', 'SENTIMENT_THRESHOLD'])``.
+    The hash changes whenever any of those values does, so a pass that
+    applies the rules only needs a full rescan when its fingerprint changes.
+    """
+    module = globals()
+    payload = json.dumps({name: module[name] for name in sorted(names)}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def load_validation_state(pass_name, filename=None):
+    """Return (fingerprint, set of validated links) recorded for `pass_name`.
+
+    Reads `filename` (default `VALIDATION_STATE_FILE`). Returns
+    (None, empty set) if the pass has never recorded its state.
+    """
+    filename = filename or VALIDATION_STATE_FILE
+    if os.path.exists(filename):
+        try:
+            with open(filename, 'r') as f:
+                entry = json.load(f).get(pass_name, {})
+            return entry.get('fingerprint'), set(entry.get('validated', []))
+        except Exception:
+            logging.warning(f"Failed to load {filename}. Rescanning everything.")
+    return None, set()
+
+
+def save_validation_state(pass_name, fingerprint, links, filename=None):
+    """Record that `links` have been validated by `pass_name` under `fingerprint`."""
+    filename = filename or VALIDATION_STATE_FILE
+    state = {}
+    if os.path.exists(filename):
+        try:
+            with open(filename, 'r') as f:
+                state = json.load(f)
+        except Exception:
+            state = {}
+    state[pass_name] = {'fingerprint': fingerprint, 'validated': sorted(set(links))}
+    write_atomic(filename, json.dumps(state, indent=2))
+
+
+def _delta_filename(last_run):
+    """Map a 'last run' timestamp to a filesystem-safe delta file name."""
+    return last_run.replace('-', '').replace(':', '') + '.json'
+
+
+def _load_delta_index():
+    if os.path.exists(DELTA_INDEX_FILE):
+        try:
+            with open(DELTA_INDEX_FILE, 'r') as f:
+                index = json.load(f)
+            if isinstance(index, dict) and isinstance(index.get('deltas'), list):
+                return index
+        except Exception:
+            logging.warning(f"Failed to load {DELTA_INDEX_FILE}. Starting a new index.")
+    return {'last run': None, 'deltas': []}
+
+
+def write_delta(last_run, since, added, archived):
+    """Publish the changes made by one run as a small delta file.
+
+    The delta is written to `DELTA_DIR/<last run>.json` and recorded at the
+    front of `DELTA_INDEX_FILE` (newest first). `since` is the 'last run' of
+    the previous snapshot, so a client that last saw `since` can apply this
+    delta and arrive at `last_run`. `added` and `archived` are lists of
+    stories, but only the links of archived stories are published. Clients
+    apply "added" first and then drop any links listed under "archived" or
+    "removed". Only the newest `MAX_DELTAS` deltas are kept; a client further
+    behind than that falls back to the full `good_news.json` snapshot.
+    """
+    os.makedirs(DELTA_DIR, exist_ok=True)
+    name = _delta_filename(last_run)
+    delta = {
+        'last run': last_run,
+        'since': since,
+        'added': added,
+        'archived': [story['link'] for story in archived],
+        'removed': [],
+    }
+    write_atomic(os.path.join(DELTA_DIR, name), json.dumps(delta, indent=2))
+
+    index = _load_delta_index()
+    entries = [e for e in index['deltas'] if e.get('last run') != last_run]
+    entries.insert(0, {
+        'last run': last_run,
+        'since': since,
+        'file': os.path.relpath(os.path.join(DELTA_DIR, name), DATA_DIR).replace(os.sep, '/'),
+        'added': len(added),
+        'archived': len(archived),
+        'removed': 0,
+    })
+
+    # Drop deltas that have rolled out of the window, both from the index
+    # and from disk.
+    for stale in entries[MAX_DELTAS:]:
+        stale_path = os.path.join(DATA_DIR, stale.get('file', ''))
+        if os.path.isfile(stale_path):
+            os.remove(stale_path)
+    entries = entries[:MAX_DELTAS]
+
+    write_atomic(DELTA_INDEX_FILE, json.dumps({'last run': last_run, 'deltas': entries}, indent=2))
+
+
+def record_delta_removals(last_run, links):
+    """Add `links` to the "removed" list of the delta published for `last_run`.
+
+    Used by the cleanup pass so clients following deltas also drop stories
+    removed after the fetch. Does nothing if no delta exists for `last_run`.
+    """
+    if not last_run or not links:
+        return
+    index = _load_delta_index()
+    for entry in index['deltas']:
+        if entry.get('last run') != last_run:
+            continue
+        path = os.path.join(DATA_DIR, entry['file'])
+        try:
+            with open(path, 'r') as f:
+                delta = json.load(f)
+        except Exception:
+            logging.warning(f"Could not update delta {path}")
+            return
+        removed = delta.get('removed', [])
+        removed.extend(link for link in links if link not in removed)
+        delta['removed'] = removed
+        write_atomic(path, json.dumps(delta, indent=2))
+        entry['removed'] = len(removed)
+        write_atomic(DELTA_INDEX_FILE, json.dumps(index, indent=2))
+        return
+
+
 def canonical_source(feed_url, feed_title=None, link=None):
     """Return a canonical source name given the feed URL, feed title, or link.
 
@@ -402,27 +1302,24 @@ def save_data(data, filename, last_run=None):
     - If `last_run` is provided, write wrapped format: {"last run": <str>, "stories": [...]}
     - If file already exists and is wrapped (dict with 'stories'), preserve wrapped format and existing 'last run' unless `last_run` is provided.
     - Otherwise write the legacy top-level list format.
-    """
-    existing = None
-    if os.path.exists(filename):
-        try:
-            with open(filename, 'r') as f:
-                existing = json.load(f)
-        except Exception:
-            existing = None
 
-    write_wrapped = last_run is not None or (isinstance(existing, dict) and 'stories' in existing)
+    The existing format is read from the head of the file (see
+    `_stored_format`) rather than by parsing it, and the write goes through
+    `write_atomic`.
+    """
+    existing_wrapped, existing_last_run = _stored_format(filename)
+    write_wrapped = last_run is not None or existing_wrapped
 
+    lr = None
     if write_wrapped:
-        lr = last_run if last_run is not None else (existing.get('last run') if isinstance(existing, dict) else None)
+        lr = last_run if last_run is not None else existing_last_run
         if not lr:
             lr = _current_timestamp_str()
         out = {'last run': lr, 'stories': data}
-        with open(filename, 'w') as f:
-            json.dump(out, f, indent=2)
     else:
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        out = data
+    write_atomic(filename, json.dumps(out, indent=2))
+    _remember_format(filename, write_wrapped, lr)
 
 def archive_old_stories(new_archived_stories):
     if not new_archived_stories:
@@ -447,167 +1344,513 @@ def archive_old_stories(new_archived_stories):
         save_data(archive_data, ARCHIVE_FILE)
         logging.info(f"Archived {added_to_archive} new stories to {ARCHIVE_FILE}.")
 
-def main():
-    logging.info("Starting Ramah News Fetcher")
-    start_time = time.time()
-    analyzer = SentimentIntensityAnalyzer()
-    
-    # Load sentence cache
-    sentence_cache = load_sentence_cache()
-    cache_hits = 0
-    cache_misses = 0
-    
-    # Initialize metrics tracking
-    metrics = {
+_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stories (
+    link TEXT PRIMARY KEY,
+    timestamp TEXT,
+    epoch REAL NOT NULL,
+    source TEXT,
+    archived INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_stories_archived_epoch ON stories (archived, epoch DESC);
+CREATE INDEX IF NOT EXISTS idx_stories_timestamp ON stories (timestamp);
+CREATE INDEX IF NOT EXISTS idx_stories_source ON stories (source);
+CREATE TABLE IF NOT EXISTS sentence_cache (
+    link TEXT PRIMARY KEY,
+    sentence TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _story_row(story, archived):
+    return (
+        story.get('link'),
+        story.get('timestamp'),
+        _parse_timestamp_to_epoch(story.get('timestamp')),
+        story.get('source'),
+        1 if archived else 0,
+        json.dumps(story),
+    )
+
+
+_INSERT_STORY_SQL = "INSERT OR IGNORE INTO stories (link, timestamp, epoch, source, archived, data) VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def db_connect(path=None):
+    """Open the SQLite store at `path` (default `SQLITE_FILE`), creating it if needed.
+
+    A new, empty store is seeded in a single transaction from the existing
+    JSON files (stories, archive, sentence cache and metrics), so switching
+    backends loses nothing.
+    """
+    conn = sqlite3.connect(path or SQLITE_FILE)
+    conn.executescript(_DB_SCHEMA)
+    if conn.execute("SELECT COUNT(*) FROM meta").fetchone()[0] == 0:
+        with conn:
+            conn.executemany(_INSERT_STORY_SQL, (_story_row(s, False) for s in iter_stories(DATA_FILE)))
+            conn.executemany(_INSERT_STORY_SQL, (_story_row(s, True) for s in iter_stories(ARCHIVE_FILE)))
+            conn.executemany("INSERT OR IGNORE INTO sentence_cache (link, sentence) VALUES (?, ?)",
+                             load_sentence_cache().items())
+            if os.path.exists(METRICS_FILE):
+                try:
+                    with open(METRICS_FILE, 'r') as f:
+                        history = json.load(f)
+                except Exception:
+                    history = []
+                conn.executemany("INSERT INTO metrics (data) VALUES (?)", ((json.dumps(m),) for m in history))
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last run', ?)",
+                         (load_last_run(DATA_FILE),))
+        logging.info(f"Initialised {path or SQLITE_FILE} from existing JSON files.")
+    return conn
+
+
+def db_has_link(conn, link):
+    """Return True if `link` is already stored (current or archived)."""
+    return conn.execute("SELECT 1 FROM stories WHERE link = ?", (link,)).fetchone() is not None
+
+
+def db_iter_stories(conn, archived=False):
+    """Yield current (or archived) stories newest first, as stored."""
+    rows = conn.execute("SELECT data FROM stories WHERE archived = ? ORDER BY epoch DESC, rowid",
+                        (1 if archived else 0,))
+    for (data,) in rows:
+        yield json.loads(data)
+
+
+def db_last_run(conn):
+    row = conn.execute("SELECT value FROM meta WHERE key = 'last run'").fetchone()
+    return row[0] if row else None
+
+
+def db_save_stories(conn, new_stories, last_run, max_stories=MAX_STORIES):
+    """Insert a run's new stories and archive the overflow in one transaction.
+
+    Stories beyond the newest `max_stories` are archived with an UPDATE
+    rather than by rewriting any file. Returns the list of stories archived.
+    """
+    overflow = ("SELECT rowid FROM stories WHERE archived = 0 "
+                "ORDER BY epoch DESC, rowid LIMIT -1 OFFSET ?")
+    with conn:
+        conn.executemany(_INSERT_STORY_SQL, (_story_row(s, False) for s in new_stories))
+        archived = [json.loads(data) for (data,) in conn.execute(
+            f"SELECT data FROM stories WHERE rowid IN ({overflow}) ORDER BY epoch DESC, rowid", (max_stories,))]
+        conn.execute(f"UPDATE stories SET archived = 1 WHERE rowid IN ({overflow})", (max_stories,))
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last run', ?)", (last_run,))
+    return archived
+
+
+def db_delete_stories(conn, links):
+    """Delete the stories with the given links in one transaction."""
+    with conn:
+        conn.executemany("DELETE FROM stories WHERE link = ?", ((link,) for link in links))
+
+
+def db_update_stories(conn, stories):
+    """Rewrite stored stories (matched by link) in one transaction."""
+    with conn:
+        conn.executemany("UPDATE stories SET timestamp = ?, epoch = ?, source = ?, data = ? WHERE link = ?",
+                         ((s.get('timestamp'), _parse_timestamp_to_epoch(s.get('timestamp')),
+                           s.get('source'), json.dumps(s), s.get('link')) for s in stories))
+
+
+def db_export(conn, archive=True):
+    """Write `DATA_FILE` (and optionally `ARCHIVE_FILE`) from the store."""
+    save_data_stream(db_iter_stories(conn), DATA_FILE, last_run=db_last_run(conn) or _current_timestamp_str())
+    if archive:
+        save_data_stream(db_iter_stories(conn, archived=True), ARCHIVE_FILE)
+
+
+class DbSentenceCache:
+    """Dict-like view of the SQLite sentence cache.
+
+    Lookups are primary-key probes rather than a load of the whole cache;
+    new sentences are buffered and written by `save_sentence_cache`.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.pending = {}
+
+    def __contains__(self, link):
+        return link in self.pending or self.conn.execute(
+            "SELECT 1 FROM sentence_cache WHERE link = ?", (link,)).fetchone() is not None
+
+    def __getitem__(self, link):
+        if link in self.pending:
+            return self.pending[link]
+        row = self.conn.execute("SELECT sentence FROM sentence_cache WHERE link = ?", (link,)).fetchone()
+        if row is None:
+            raise KeyError(link)
+        return row[0]
+
+    def __setitem__(self, link, sentence):
+        self.pending[link] = sentence
+
+
+def _new_metrics():
+    """Return a fresh metrics record for one run (or one daemon flush)."""
+    return {
         'timestamp': _current_timestamp_str(),
         'feeds_checked': 0,
         'feeds_failed': 0,
+        'failed_feeds': [],
+        'feeds_skipped': [],
         'entries_processed': 0,
         'entries_blocked': 0,
         'entries_sentiment_rejected': 0,
         'entries_accepted': 0,
         'stories_by_source': {},
+        'stories_by_feed': {},
         'cache_hits': 0,
         'cache_misses': 0,
+        'article_fetches_avoided': 0,
+        'scrapes_skipped': 0,
+        'feeds_oversized': 0,
+        'feeds_rejected': 0,
+        'articles_oversized': 0,
+        'articles_rejected': 0,
+        'extraction_by_source': {},
         'execution_time_seconds': 0
     }
-    
-    current_data = load_data(DATA_FILE)
+
+
+def start_run(analyzer, time_budget=None):
+    """Load the stored stories and sentence cache and return the run state.
+
+    The returned dict is threaded through `process_feed` and `finish_run`.
+    `analyzer` is a VADER SentimentIntensityAnalyzer, passed in so that a
+    daemon can keep one warm across runs. `time_budget` (seconds) sets the
+    run's deadline; None or 0 means no deadline.
+
+    With the SQLite backend, the stored stories are not loaded at all:
+    `current_data` only collects this run's stories and duplicates are found
+    by probing the store's link index. Both backends treat archived stories
+    as already seen, so a story that reappears in a feed after being
+    archived is not added again.
+    """
+    conn = db_connect() if STORAGE_BACKEND == 'sqlite' else None
+    current_data = load_data(DATA_FILE) if conn is None else []
+    # Create a set of existing URLs for fast deduplication; with JSON storage
+    # this includes the archive's links, streamed so it is never fully loaded
+    existing_urls = {item['link'] for item in current_data}
+    if conn is None:
+        existing_urls.update(story.get('link') for story in iter_stories(ARCHIVE_FILE))
 
     # Ensure existing data is reverse-chronologically sorted and build
     # a helper list of negative epochs for insertion (negatives make it
     # suitable for bisect on ascending order).
     current_data = _ensure_reverse_chrono_sorted(current_data)
-    neg_epochs = [ -_parse_timestamp_to_epoch(item.get('timestamp')) for item in current_data ]
 
-    # Create a set of existing URLs for fast deduplication
-    existing_urls = {item['link'] for item in current_data}
+    start_time = time.time()
+    return {
+        'start_time': start_time,
+        'deadline': start_time + time_budget if time_budget else None,
+        'analyzer': analyzer,
+        'db': conn,
+        'sentence_cache': load_sentence_cache() if conn is None else DbSentenceCache(conn),
+        'metrics': _new_metrics(),
+        'extraction_stats': {},
+        'previous_last_run': load_last_run(DATA_FILE),
+        'current_data': current_data,
+        'neg_epochs': [ -_parse_timestamp_to_epoch(item.get('timestamp')) for item in current_data ],
+        'existing_urls': existing_urls,
+        'added_stories': [],
+    }
+
+
+def _time_left(state):
+    """Seconds until the run's deadline (infinite if it has none)."""
+    if state['deadline'] is None:
+        return float('inf')
+    return state['deadline'] - time.time()
+
 
-    new_stories_count = 0
+def _collect_candidates(state, feed_url, candidates):
+    """Fetch `feed_url` and append its unseen entries to `candidates`.
 
-    for feed_url in RSS_FEEDS:
-        logging.info(f"Checking feed: {feed_url}")
-        metrics['feeds_checked'] += 1
+    URL-blocked entries are counted and dropped here. Entries whose headline
+    hits BLOCK_LIST are kept, but flagged, so `_ingest_candidate` can count
+    them in the original feed order. Returns the parsed feed, or None if it
+    could not be fetched or parsed.
+    """
+    metrics = state['metrics']
+    existing_urls = state['existing_urls']
+
+    logging.info(f"Checking feed: {feed_url}")
+    metrics['feeds_checked'] += 1
+    
+    feed = fetch_feed_with_retry(feed_url, deadline=state['deadline'], metrics=metrics)
+    if feed is None:
+        metrics['feeds_failed'] += 1
+        metrics['failed_feeds'].append(feed_url)
+        return None
         
-        feed = fetch_feed_with_retry(feed_url)
-        if feed is None:
-            metrics['feeds_failed'] += 1
-            continue
-            
-        if feed.bozo:
-            # Check if it's just a warning or a fatal error
-            if isinstance(feed.bozo_exception, (feedparser.CharacterEncodingOverride, feedparser.NonXMLContentType)):
-                logging.warning(f"Feed {feed_url} has a parsing warning: {feed.bozo_exception}. Proceeding anyway.")
-            else:
-                logging.error(f"Error parsing feed {feed_url}: {feed.bozo_exception}")
-                continue
-            
-        for entry in feed.entries:
-            link = entry.get('link')
-            metrics['entries_processed'] += 1
-            
+    if feed.bozo:
+        # Check if it's just a warning or a fatal error
+        if isinstance(feed.bozo_exception, (feedparser.CharacterEncodingOverride, feedparser.NonXMLContentType)):
+            logging.warning(f"Feed {feed_url} has a parsing warning: {feed.bozo_exception}. Proceeding anyway.")
+        else:
+            logging.error(f"Error parsing feed {feed_url}: {feed.bozo_exception}")
+            return None
+        
+    for entry in feed.entries:
+        link = entry.get('link')
+        title = entry.get('title', '')
+        metrics['entries_processed'] += 1
+        
+        with profile_stage('block'):
             # Skip individual entries whose URL matches the blocklist
-            if link and any(block in link for block in URL_BLOCKLIST):
-                logging.debug(f"Skipping blocked URL: {link}")
-                metrics['entries_blocked'] += 1
-                continue
-
-            if link in existing_urls:
-                continue
-            
-            title = entry.get('title', '')
-            
+            url_blocked = bool(link and any(block in link for block in URL_BLOCKLIST))
+            known = not url_blocked and (
+                link in existing_urls or (state['db'] is not None and db_has_link(state['db'], link)))
             # Block list check
-            if any(blocked_word.lower() in title.lower() for blocked_word in BLOCK_LIST):
-                logging.debug(f"Skipping blocked headline: {title}")
-                metrics['entries_blocked'] += 1
-                continue
-            
-            # Sentiment Analysis
-            # 1. VADER
-            vader_score = analyzer.polarity_scores(title)['compound']
-            
-            # 2. TextBlob
-            textblob_score = TextBlob(title).sentiment.polarity
-            
-            # 3. Mean
-            mean_score = (vader_score + textblob_score) / 2
-            
-            if mean_score > SENTIMENT_THRESHOLD:
-                metrics['entries_accepted'] += 1
-                logging.info(f"Found good news: {title} (Mean Score: {mean_score:.4f}, VADER: {vader_score:.4f}, TextBlob: {textblob_score:.4f})")
-                
-                # Check cache first, then fetch first sentence if not cached
-                if link in sentence_cache:
-                    first_sentence = sentence_cache[link]
-                    cache_hits += 1
-                    logging.debug(f"Cache hit for {link}")
-                else:
-                    first_sentence = get_first_sentence(link)
-                    cache_misses += 1
-                    if first_sentence:
-                        sentence_cache[link] = first_sentence
-                
-                # If scraping failed, try using description/summary from RSS
-                if not first_sentence:
-                    summary = entry.get('summary') or entry.get('description', '')
-                    if summary:
-                         # Strip HTML from summary if present
-                        soup_summary = BeautifulSoup(summary, 'html.parser')
-                        text_summary = soup_summary.get_text().strip()
-                        if text_summary:
-                            first_sentence = text_summary.split('.')[0] + '.'
-                
-                # Get publication time from feed, fallback to current time
-                # Convert everything to UTC for consistent sorting
-                published_parsed = entry.get('published_parsed')
-                if published_parsed:
-                    # published_parsed is a time.struct_time in UTC
-                    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", published_parsed)
-                else:
-                    # Fallback to current time in UTC
-                    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-
-                # Determine canonical source name using prioritized heuristics
-                source = canonical_source(feed_url, feed.feed.get('title', 'Unknown Source'), link)
-                
-                # Track stories by source
-                if source not in metrics['stories_by_source']:
-                    metrics['stories_by_source'][source] = 0
-                metrics['stories_by_source'][source] += 1
-
-                news_item = {
-                    'headline': title,
-                    'link': link,
-                    'mean_score': round(mean_score, 4),
-                    'vader_score': round(vader_score, 4),
-                    'textblob_score': round(textblob_score, 4),
-                    'first_sentence': first_sentence or "Summary not available.",
-                    'timestamp': timestamp,
-                    'source': source
-                }
-                
-                # Insert story in the correctly-sorted position by timestamp.
-                # We compute its epoch and insert using bisect to keep the
-                # list reverse-chronological (newest first). For identical
-                # timestamps we insert after existing equal timestamps so
-                # the newest-arrived stories appear after earlier ones with
-                # the same published time.
-                story_epoch = _parse_timestamp_to_epoch(news_item.get('timestamp'))
-                insert_key = -story_epoch
-                idx = bisect.bisect_right(neg_epochs, insert_key)
-                neg_epochs.insert(idx, insert_key)
-                current_data.insert(idx, news_item)
-
-                existing_urls.add(link)
-                new_stories_count += 1
-            else:
-                metrics['entries_sentiment_rejected'] += 1
+            headline_blocked = not (url_blocked or known) and \
+                any(blocked_word.lower() in title.lower() for blocked_word in BLOCK_LIST)
+
+        if url_blocked:
+            logging.debug(f"Skipping blocked URL: {link}")
+            metrics['entries_blocked'] += 1
+            continue
+
+        if known:
+            continue
+
+        candidates.append({
+            'feed_url': feed_url,
+            'feed': feed,
+            'entry': entry,
+            'link': link,
+            'title': title,
+            'headline_blocked': headline_blocked,
+        })
+
+    return feed
+
+
+_headline_analyzers = None  # (VADER, TextBlob PatternAnalyzer) for this process
+
+
+def _init_headline_analyzers(vader=None):
+    """Create this process's analyzers; also the pool worker initializer."""
+    global _headline_analyzers
+    _headline_analyzers = (vader or SentimentIntensityAnalyzer(), PatternAnalyzer())
+
+
+def _score_headline_chunk(titles):
+    """Return [(VADER compound, TextBlob polarity)] for `titles`.
+
+    PatternAnalyzer is what `TextBlob(title).sentiment` runs, minus building
+    a blob for every title.
+    """
+    vader, pattern = _headline_analyzers
+    return [(vader.polarity_scores(title)['compound'], pattern.analyze(title).polarity) for title in titles]
+
+
+def score_headlines(titles, analyzer=None):
+    """Score `titles` and return {title: (vader_score, textblob_score)}.
+
+    Large batches are split into SCORE_CHUNK_SIZE chunks and scored across a
+    process pool, where each worker builds its own analyzers once. Batches
+    under SCORE_POOL_MIN_HEADLINES, single-CPU machines, and pools that
+    cannot start are scored in this process with `analyzer` (a VADER
+    SentimentIntensityAnalyzer). The scores are the same either way.
+    """
+    titles = list(dict.fromkeys(titles))
+    workers = SCORE_WORKERS or os.cpu_count() or 1
+    if workers > 1 and len(titles) >= SCORE_POOL_MIN_HEADLINES:
+        chunks = [titles[i:i + SCORE_CHUNK_SIZE] for i in range(0, len(titles), SCORE_CHUNK_SIZE)]
+        try:
+            with ProcessPoolExecutor(min(workers, len(chunks)), initializer=_init_headline_analyzers) as pool:
+                scores = [score for chunk in pool.map(_score_headline_chunk, chunks) for score in chunk]
+            return dict(zip(titles, scores))
+        except Exception as e:
+            logging.warning(f"Headline scoring pool failed ({e}); scoring in-process.")
+
+    if _headline_analyzers is None or (analyzer is not None and _headline_analyzers[0] is not analyzer):
+        _init_headline_analyzers(analyzer)
+    return dict(zip(titles, _score_headline_chunk(titles)))
+
+
+def _ingest_candidate(state, item, scores):
+    """Apply the accept/reject decision to one `item` from `_collect_candidates`.
+
+    Candidates are ingested in feed order, so an entry whose link was
+    accepted from an earlier feed in the same batch is skipped, as it would
+    have been if each feed had been processed on its own.
+    """
+    metrics = state['metrics']
+    sentence_cache = state['sentence_cache']
+    existing_urls = state['existing_urls']
+    feed_url, feed, entry = item['feed_url'], item['feed'], item['entry']
+    link, title = item['link'], item['title']
+
+    if link in existing_urls:
+        return
+
+    if item['headline_blocked']:
+        logging.debug(f"Skipping blocked headline: {title}")
+        metrics['entries_blocked'] += 1
+        return
+    
+    # Sentiment Analysis: the mean of VADER and TextBlob
+    vader_score, textblob_score = scores[title]
+    mean_score = (vader_score + textblob_score) / 2
+    
+    if mean_score > SENTIMENT_THRESHOLD:
+        metrics['entries_accepted'] += 1
+        logging.info(f"Found good news: {title} (Mean Score: {mean_score:.4f}, VADER: {vader_score:.4f}, TextBlob: {textblob_score:.4f})")
+        
+        # Determine canonical source name using prioritized heuristics
+        source = canonical_source(feed_url, feed.feed.get('title', 'Unknown Source'), link)
+
+        # Check cache first, then the feed entry's own content for
+        # sources configured for it, and only then fetch the article
+        feed_sentence = None
+        if link in sentence_cache:
+            first_sentence = sentence_cache[link]
+            metrics['cache_hits'] += 1
+            logging.debug(f"Cache hit for {link}")
+        else:
+            first_sentence = None
+            metrics['cache_misses'] += 1
+            min_score = FEED_SUMMARY_MIN_SCORE.get(source)
+            if min_score is not None:
+                candidate, score = sentence_from_entry(entry)
+                # Kept as the fallback if the article fetch fails, unless
+                # it was disqualified as boilerplate or a headline repeat
+                feed_sentence = candidate if score > 0 else None
+                if score >= min_score:
+                    first_sentence = candidate
+                    metrics['article_fetches_avoided'] += 1
+                    logging.debug(f"Using feed content for {link} (score {score})")
+            if not first_sentence and _time_left(state) < SCRAPE_RESERVE:
+                # Out of time for article fetches; use the feed summary
+                metrics['scrapes_skipped'] += 1
+                logging.debug(f"Skipping article fetch for {link}: run deadline near")
+            elif not first_sentence:
+                first_sentence = get_first_sentence(link, state['extraction_stats'], state['deadline'], metrics)
+            if first_sentence:
+                sentence_cache[link] = first_sentence
+        
+        # If scraping failed, use the sentence already taken from the feed
+        # entry, or else the description/summary from RSS
+        if not first_sentence and feed_sentence:
+            first_sentence = feed_sentence
+        if not first_sentence:
+            summary = entry.get('summary') or entry.get('description', '')
+            if summary:
+                 # Strip HTML from summary if present
+                soup_summary = BeautifulSoup(summary, 'html.parser')
+                text_summary = soup_summary.get_text().strip()
+                if text_summary:
+                    first_sentence = text_summary.split('.')[0] + '.'
+        
+        # Get publication time from feed, fallback to current time
+        # Convert everything to UTC for consistent sorting
+        published_parsed = entry.get('published_parsed')
+        if published_parsed:
+            # published_parsed is a time.struct_time in UTC
+            timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", published_parsed)
+        else:
+            # Fallback to current time in UTC
+            timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+        # Track stories by source
+        if source not in metrics['stories_by_source']:
+            metrics['stories_by_source'][source] = 0
+        metrics['stories_by_source'][source] += 1
+        metrics['stories_by_feed'][feed_url] = metrics['stories_by_feed'].get(feed_url, 0) + 1
+
+        news_item = {
+            'headline': title,
+            'link': link,
+            'mean_score': round(mean_score, 4),
+            'vader_score': round(vader_score, 4),
+            'textblob_score': round(textblob_score, 4),
+            'first_sentence': first_sentence or "Summary not available.",
+            'timestamp': timestamp,
+            'source': source
+        }
+        
+        # Insert story in the correctly-sorted position by timestamp.
+        # We compute its epoch and insert using bisect to keep the
+        # list reverse-chronological (newest first). For identical
+        # timestamps we insert after existing equal timestamps so
+        # the newest-arrived stories appear after earlier ones with
+        # the same published time.
+        story_epoch = _parse_timestamp_to_epoch(news_item.get('timestamp'))
+        insert_key = -story_epoch
+        idx = bisect.bisect_right(state['neg_epochs'], insert_key)
+        state['neg_epochs'].insert(idx, insert_key)
+        state['current_data'].insert(idx, news_item)
+
+        existing_urls.add(link)
+        state['added_stories'].append(news_item)
+    else:
+        metrics['entries_sentiment_rejected'] += 1
+
+
+def process_feeds(state, feed_urls):
+    """Fetch `feed_urls` and ingest their new positive stories into `state`.
+
+    Runs in three stages: every feed is fetched and filtered, then all
+    candidate headlines are scored in one batch (`score_headlines`), then the
+    results are applied in feed order. Feeds reached with less than
+    SAVE_RESERVE seconds left are skipped. Returns {feed_url: parsed feed, or
+    None if it could not be fetched or parsed} for the feeds attempted.
+    """
+    metrics = state['metrics']
+    feeds = {}
+    candidates = []
+    for feed_url in feed_urls:
+        if _time_left(state) < SAVE_RESERVE:
+            metrics['feeds_skipped'].append(feed_url)
+            continue
+        feeds[feed_url] = _collect_candidates(state, feed_url, candidates)
+
+    with profile_stage('score'):
+        scores = score_headlines([c['title'] for c in candidates if not c['headline_blocked']], state['analyzer'])
+
+    for candidate in candidates:
+        _ingest_candidate(state, candidate, scores)
+    return feeds
+
+
+def process_feed(state, feed_url):
+    """Fetch `feed_url` and ingest its new positive stories into `state`.
+
+    Returns the parsed feed, or None if it could not be fetched or parsed.
+    """
+    return process_feeds(state, [feed_url]).get(feed_url)
+
+
+@profile_stage('save', snapshot=True)
+def finish_run(state):
+    """Save stories, archive, delta, metrics and sentence cache for a run."""
+    metrics = state['metrics']
+    current_data = state['current_data']
+    added_stories = state['added_stories']
 
     # Record the time this fetch run completed (UTC).
     last_run = _current_timestamp_str()
+    archive_stories = []
 
-    if new_stories_count > 0:
+    if state['db'] is not None:
+        archive_stories = db_save_stories(state['db'], added_stories, last_run)
+        db_export(state['db'], archive=bool(archive_stories))
+        logging.info(f"Stored {len(added_stories)} new stories in {SQLITE_FILE} and exported {DATA_FILE}.")
+        if archive_stories:
+            logging.info(f"Archived {len(archive_stories)} stories.")
+    elif added_stories:
         # Trim/keep the most recent MAX_STORIES (current_data is already
         # reverse-chronological due to insertion logic)
         keep_stories = current_data[:MAX_STORIES]
@@ -623,17 +1866,183 @@ def main():
         # in the data file (preserving wrapped format if present).
         save_data(current_data, DATA_FILE, last_run=last_run)
         logging.info("No new positive stories found; updated last run timestamp.")
+
+    # Publish what changed in this run, even when nothing did, so the chain
+    # of deltas stays unbroken for polling clients.
+    write_delta(last_run, state['previous_last_run'], added_stories, archive_stories)
     
     # Calculate execution time and save metrics
-    metrics['execution_time_seconds'] = round(time.time() - start_time, 2)
-    metrics['cache_hits'] = cache_hits
-    metrics['cache_misses'] = cache_misses
-    save_run_metrics(metrics)
-    save_sentence_cache(sentence_cache)
+    metrics['execution_time_seconds'] = round(time.time() - state['start_time'], 2)
+    metrics['extraction_by_source'] = summarize_extraction_stats(state['extraction_stats'])
+    save_run_metrics(metrics, state['db'])
+    save_sentence_cache(state['sentence_cache'])
     logging.info(f"Run metrics - Feeds: {metrics['feeds_checked']} checked, {metrics['feeds_failed']} failed | "
                  f"Entries: {metrics['entries_processed']} processed, {metrics['entries_accepted']} accepted | "
-                 f"Cache: {cache_hits} hits, {cache_misses} misses | "
+                 f"Cache: {metrics['cache_hits']} hits, {metrics['cache_misses']} misses | "
+                 f"Article fetches avoided: {metrics['article_fetches_avoided']} | "
+                 f"Downloads refused: {metrics['feeds_oversized'] + metrics['articles_oversized']} oversized, "
+                 f"{metrics['feeds_rejected'] + metrics['articles_rejected']} wrong type | "
                  f"Duration: {metrics['execution_time_seconds']}s")
 
+    if state['db'] is not None:
+        state['db'].close()
+
+
+def main(time_budget=RUN_TIME_BUDGET):
+    logging.info("Starting Ramah News Fetcher")
+    state = start_run(SentimentIntensityAnalyzer(), time_budget)
+    metrics = state['metrics']
+
+    # Most productive and reliable feeds first, so anything shed to meet
+    # the deadline is the least valuable work. Whatever happens, save.
+    try:
+        process_feeds(state, prioritize_feeds(RSS_FEEDS, load_run_metrics()))
+    finally:
+        if metrics['feeds_skipped'] or metrics['scrapes_skipped']:
+            logging.warning(f"Run deadline reached: skipped {len(metrics['feeds_skipped'])} feeds "
+                            f"and {metrics['scrapes_skipped']} article fetches.")
+        finish_run(state)
+
+
+def learn_poll_interval(feed, previous=None):
+    """Estimate how often `feed` should be polled from its entries' publish times.
+
+    Uses the median gap between the newest `DAEMON_POLL_SAMPLE` entries,
+    clamped to [DAEMON_MIN_INTERVAL, DAEMON_MAX_INTERVAL] and averaged with
+    the `previous` estimate so a single burst does not swing the schedule.
+    Feeds without usable dates keep their previous interval.
+    """
+    epochs = sorted(
+        (calendar.timegm(e.published_parsed) for e in feed.entries if e.get('published_parsed')),
+        reverse=True,
+    )[:DAEMON_POLL_SAMPLE]
+    gaps = [newer - older for newer, older in zip(epochs, epochs[1:]) if newer > older]
+    if not gaps:
+        return previous or DAEMON_DEFAULT_INTERVAL
+
+    observed = min(max(statistics.median(gaps), DAEMON_MIN_INTERVAL), DAEMON_MAX_INTERVAL)
+    if previous:
+        observed = (previous + observed) / 2
+    return round(observed)
+
+
+def run_flush_scripts():
+    """Run DAEMON_FLUSH_SCRIPTS in order, as the scheduled workflow does.
+
+    Each script runs in its own process, so it sees the files just flushed.
+    A failing script is logged and does not stop the ones after it.
+    """
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    for script in DAEMON_FLUSH_SCRIPTS:
+        result = subprocess.run([sys.executable, os.path.join(scripts_dir, script)],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode:
+            logging.error(f"{script} failed with exit code {result.returncode}: {result.stderr.strip()[-500:]}")
+
+
+def run_daemon(flush_interval=DAEMON_FLUSH_INTERVAL, max_flushes=None):
+    """Run as a long-lived scheduler instead of a one-shot fetch.
+
+    The sentiment analyzers and the HTTP session stay warm between polls.
+    Each feed is polled on its own interval learned by `learn_poll_interval`
+    (failed feeds back off by doubling it). Every `flush_interval` seconds,
+    and once more on shutdown (Ctrl-C or SIGTERM), stories, archive, delta,
+    metrics and the sentence cache are flushed and the rest of the pipeline
+    (cleanup, normalization, RSS and partitions; see `run_flush_scripts`)
+    runs. A shutdown signal that arrives during a flush takes effect once
+    the flush has finished, and nothing is flushed twice. `max_flushes`
+    stops the loop after that many flushes, which is mainly useful for
+    testing.
+    """
+    logging.info(f"Starting Ramah News Fetcher in daemon mode (flush every {flush_interval}s)")
+
+    shutdown = {'flushing': False, 'requested': False}
+
+    def _terminate(signum, frame):
+        # Never abandon a flush half-written: stop once it has finished
+        if shutdown['flushing']:
+            shutdown['requested'] = True
+        else:
+            raise KeyboardInterrupt
+
+    def _flush(state):
+        shutdown['flushing'] = True
+        try:
+            finish_run(state)
+            run_flush_scripts()
+        finally:
+            shutdown['flushing'] = False
+
+    previous_handlers = {sig: signal.signal(sig, _terminate) for sig in (signal.SIGTERM, signal.SIGINT)}
+
+    analyzer = SentimentIntensityAnalyzer()
+    # Load the TextBlob lexicon once up front rather than on the first headline
+    score_headlines(["warm up"], analyzer)
+
+    now = time.time()
+    schedule = {feed_url: {'interval': DAEMON_DEFAULT_INTERVAL, 'next_poll': now} for feed_url in RSS_FEEDS}
+    state = start_run(analyzer)
+    next_flush = now + flush_interval
+    flushes = 0
+
+    try:
+        while True:
+            due = [url for _, url in sorted((s['next_poll'], url) for url, s in schedule.items()
+                                            if s['next_poll'] <= time.time())]
+            feeds = process_feeds(state, due) if due else {}
+            for feed_url in due:
+                entry = schedule[feed_url]
+                feed = feeds.get(feed_url)
+                if feed is None:
+                    entry['interval'] = min(entry['interval'] * 2, DAEMON_MAX_INTERVAL)
+                else:
+                    entry['interval'] = learn_poll_interval(feed, entry['interval'])
+                entry['next_poll'] = time.time() + entry['interval']
+                logging.debug(f"Next poll of {feed_url} in {entry['interval']}s")
+
+            if time.time() >= next_flush:
+                if state['metrics']['feeds_checked']:
+                    _flush(state)
+                    # A flushed state must never be flushed again on shutdown
+                    state = None
+                    flushes += 1
+                    if shutdown['requested'] or (max_flushes is not None and flushes >= max_flushes):
+                        if shutdown['requested']:
+                            logging.info("Shutting down daemon")
+                        return
+                    state = start_run(analyzer)
+                next_flush = time.time() + flush_interval
+
+            wake = min(min(s['next_poll'] for s in schedule.values()), next_flush)
+            time.sleep(max(0, wake - time.time()))
+    except KeyboardInterrupt:
+        logging.info("Shutting down daemon")
+        if state is not None and state['metrics']['feeds_checked']:
+            _flush(state)
+    finally:
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Fetch, filter and store good news from RSS feeds.")
+    parser.add_argument('--daemon', action='store_true',
+                        help="keep running, poll each feed on its own learned schedule, and run cleanup, "
+                             "normalization and RSS generation after every flush")
+    parser.add_argument('--flush-interval', type=int, default=DAEMON_FLUSH_INTERVAL,
+                        help=f"seconds between output flushes in daemon mode (default {DAEMON_FLUSH_INTERVAL})")
+    parser.add_argument('--time-budget', type=int, default=RUN_TIME_BUDGET,
+                        help=f"seconds a one-shot run may take before shedding work, 0 for no limit (default {RUN_TIME_BUDGET})")
+    parser.add_argument('--profile', action='store_true',
+                        help=f"write per-stage CPU and memory profiles to {PROFILE_DIR} (or set RAMAH_PROFILE=1)")
+    args = parser.parse_args()
+
+    if profiling_requested(args.profile):
+        enable_profiling()
+    try:
+        if args.daemon:
+            run_daemon(args.flush_interval)
+        else:
+            main(args.time_budget)
+    finally:
+        write_profile_report('fetch')
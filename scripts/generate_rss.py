@@ -1,26 +1,84 @@
+import argparse
+import hashlib
+import itertools
 import json
 import os
-from datetime import datetime
+import re
+import importlib.util
+import pathlib
+from datetime import datetime, timezone
 from xml.sax.saxutils import escape
 
-def generate_rss_feed(json_file, xml_file, feed_title, feed_description):
-    """Generate an RSS 2.0 XML feed from a JSON news file."""
+# Load fetch_news as a module by file path so we don't rely on package imports.
+fetch_news_path = pathlib.Path(__file__).resolve().parent / 'fetch_news.py'
+spec = importlib.util.spec_from_file_location('fetch_news', str(fetch_news_path))
+fetch_news = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(fetch_news)
+
+def render_rss_item(story):
+    """Render a single story as an RSS <item> element."""
+    headline = escape(story.get('headline', ''))
+    link = escape(story.get('link', ''))
+    description = escape(story.get('first_sentence', 'No description available.'))
+    source = escape(story.get('source', 'Unknown Source'))
+    pub_date = story.get('timestamp', '')
+    
+    # Convert ISO timestamp to RFC 822 for RSS pubDate
+    try:
+        dt = datetime.strptime(pub_date, '%Y-%m-%dT%H:%M:%SZ')
+        pub_date_rfc822 = dt.strftime('%a, %d %b %Y %H:%M:%S GMT')
+    except:
+        # Other formats (e.g. a +1100 offset); only fall back to "now" if the
+        # timestamp is unusable, since that changes the feed on every run
+        epoch = fetch_news._parse_timestamp_to_epoch(pub_date)
+        dt = datetime.utcfromtimestamp(epoch) if epoch else datetime.utcnow()
+        pub_date_rfc822 = dt.strftime('%a, %d %b %Y %H:%M:%S GMT')
+    
+    return f"""    <item>
+      <title>{headline}</title>
+      <link>{link}</link>
+      <description>{description}</description>
+      <source>{source}</source>
+      <pubDate>{pub_date_rfc822}</pubDate>
+      <guid isPermaLink="true">{link}</guid>
+    </item>"""
+
+def generate_rss_feed(json_file, xml_file, feed_title, feed_description, manifest=None, partition_rss=False):
+    """Generate an RSS 2.0 XML feed from a JSON news file.
+
+    With a partition `manifest` (see `partitioned`), the per-source and per-day
+    partitions are written in the same pass, with their own RSS feeds if
+    `partition_rss` is set.
+    """
     
     if not os.path.exists(json_file):
         print(f"Warning: {json_file} not found. Skipping RSS generation.")
         return
     
-    # Load the JSON data
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Handle both wrapped format (dict with 'stories') and legacy format (list)
-    if isinstance(data, dict):
-        stories = data.get('stories', [])
-        last_build_date = data.get('last run', datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'))
-    else:
-        stories = data
-        last_build_date = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    # Stories are streamed from the JSON file and each item is written as soon
+    # as it is rendered, so the archive is never held in memory. Both the
+    # wrapped format (dict with 'stories') and legacy format (list) are read.
+    stories = fetch_news.iter_stories(json_file)
+    if manifest is not None:
+        name = os.path.splitext(os.path.basename(json_file))[0]
+        stories = partitioned(stories, name, manifest, feed_title if partition_rss else None)
+    write_rss_feed(stories, xml_file, feed_title, feed_description, fetch_news.load_last_run(json_file))
+
+
+@fetch_news.profile_stage('rss', snapshot=True)
+def write_rss_feed(stories, xml_file, feed_title, feed_description, last_build_date=None, self_link=None):
+    """Write an RSS 2.0 XML feed for an iterable of stories.
+
+    `self_link` is the feed's path under the site root (default: the file name).
+    Without `last_build_date` the newest (first) story's timestamp is used, so
+    an unchanged archive produces an unchanged feed.
+    """
+    stories = iter(stories)
+    first = next(stories, None)
+    if first is not None:
+        stories = itertools.chain([first], stories)
+        last_build_date = last_build_date or first.get('timestamp')
+    last_build_date = last_build_date or datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
     
     # Convert ISO timestamp to RFC 822 format for RSS
     try:
@@ -29,35 +87,7 @@ def generate_rss_feed(json_file, xml_file, feed_title, feed_description):
     except:
         last_build_date_rfc822 = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
     
-    # Start building the RSS XML
-    rss_items = []
-    for story in stories:
-        headline = escape(story.get('headline', ''))
-        link = escape(story.get('link', ''))
-        description = escape(story.get('first_sentence', 'No description available.'))
-        source = escape(story.get('source', 'Unknown Source'))
-        pub_date = story.get('timestamp', '')
-        
-        # Convert ISO timestamp to RFC 822 for RSS pubDate
-        try:
-            dt = datetime.strptime(pub_date, '%Y-%m-%dT%H:%M:%SZ')
-            pub_date_rfc822 = dt.strftime('%a, %d %b %Y %H:%M:%S GMT')
-        except:
-            pub_date_rfc822 = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
-        
-        # Build RSS item
-        item = f"""    <item>
-      <title>{headline}</title>
-      <link>{link}</link>
-      <description>{description}</description>
-      <source>{source}</source>
-      <pubDate>{pub_date_rfc822}</pubDate>
-      <guid isPermaLink="true">{link}</guid>
-    </item>"""
-        rss_items.append(item)
-    
-    # Build complete RSS feed
-    rss_feed = f"""<?xml version="1.0" encoding="UTF-8"?>
+    header = f"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
   <channel>
     <title>{escape(feed_title)}</title>
@@ -65,39 +95,254 @@ def generate_rss_feed(json_file, xml_file, feed_title, feed_description):
     <description>{escape(feed_description)}</description>
     <language>en</language>
     <lastBuildDate>{last_build_date_rfc822}</lastBuildDate>
-    <atom:link href="https://lewdry.github.io/ramah/{os.path.basename(xml_file)}" rel="self" type="application/rss+xml"/>
-{chr(10).join(rss_items)}
+    <atom:link href="https://lewdry.github.io/ramah/{self_link or os.path.basename(xml_file)}" rel="self" type="application/rss+xml"/>
+"""
+    footer = """
   </channel>
 </rss>"""
-    
-    # Write to file
-    with open(xml_file, 'w', encoding='utf-8') as f:
-        f.write(rss_feed)
-    
-    print(f"Generated {xml_file} with {len(stories)} items")
 
-def main():
+    count = 0
+
+    def chunks():
+        nonlocal count
+        yield header
+        for story in stories:
+            yield ('\n' if count else '') + render_rss_item(story)
+            count += 1
+        yield footer
+
+    # Written atomically, and left alone if nothing changed since the last run
+    if fetch_news.write_atomic(xml_file, chunks()):
+        print(f"Generated {xml_file} with {count} items")
+    else:
+        print(f"{xml_file} unchanged ({count} items)")
+
+# Partitions: the same stories split by source and by publication day
+PARTITION_KINDS = ('source', 'date')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+def partition_key(story, kind, epoch=None):
+    """Return the partition `story` belongs to: its source name or its UTC day.
+
+    The day is taken from the parsed timestamp, so offsets such as +1100 are
+    converted to UTC first. `epoch` may be passed if it is already known.
+    Unparseable timestamps go to the 'unknown' day.
+    """
+    if kind == 'source':
+        return story.get('source', 'Unknown Source')
+    if epoch is None:
+        epoch = fetch_news._parse_timestamp_to_epoch(story.get('timestamp'))
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime('%Y-%m-%d') if epoch else 'unknown'
+
+
+def _iso_utc(epoch):
+    """Format an epoch as the stories' UTC timestamp format, or None if it is 0."""
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ') if epoch else None
+
+
+def _partition_path(name, kind, key):
+    slug = _SLUG_RE.sub('-', key.lower()).strip('-') or 'unknown'
+    return os.path.join(fetch_news.PARTITION_DIR, name, kind, slug + '.json')
+
+
+def _site_path(path):
+    """Path of an output file relative to the published `docs/` directory."""
+    return os.path.relpath(path, fetch_news.DATA_DIR).replace(os.sep, '/')
+
+
+def _partition_open(part):
+    """(Re)open a partition's temporary file for appending, unless it is open."""
+    if part['file'] is None:
+        part['file'] = open(part['tmp'], 'a', encoding='utf-8')
+
+
+def _partition_close(part):
+    if part['file'] is not None:
+        part['file'].close()
+        part['file'] = None
+
+
+def _partition_write(part, text):
+    part['file'].write(text)
+    data = text.encode('utf-8')
+    part['hash'].update(data)
+    part['bytes'] += len(data)
+
+
+def _load_partition_manifest():
+    if os.path.exists(fetch_news.PARTITION_MANIFEST_FILE):
+        try:
+            with open(fetch_news.PARTITION_MANIFEST_FILE, 'r') as f:
+                return json.load(f)
+        except Exception:
+            print(f"Warning: could not read {fetch_news.PARTITION_MANIFEST_FILE}. Rewriting all partitions.")
+    return {}
+
+
+def partitioned(stories, name, manifest, feed_title=None):
+    """Yield `stories` unchanged while splitting them into partition files.
+
+    Each story is appended to `PARTITION_DIR/<name>/source/<source>.json` and
+    `PARTITION_DIR/<name>/date/<YYYY-MM-DD>.json` as it passes through, so the
+    partitions come out of the same single pass that writes the RSS feed.
+    Partitions are JSON lists in the legacy story-file format, with no 'last
+    run', so their hash depends only on their stories. Each one is written to
+    a temporary file and only replaces the published file when its sha256
+    differs from the one in `manifest`. Partitions that no longer exist are
+    deleted. `manifest[name]` is updated once the stories are exhausted.
+
+    With `feed_title`, an RSS feed is also written next to every changed
+    partition.
+
+    Stories are expected newest first, as the story files are kept, so only one
+    day partition is open at a time. Per-source partitions stay open for the
+    whole pass.
+    """
+    previous = manifest.get(name, {})
+    parts = {kind: {} for kind in PARTITION_KINDS}
+    open_day = None
+
+    try:
+        for story in stories:
+            epoch = fetch_news._parse_timestamp_to_epoch(story.get('timestamp'))
+            for kind in PARTITION_KINDS:
+                key = partition_key(story, kind, epoch)
+                part = parts[kind].get(key)
+                if part is None:
+                    path = _partition_path(name, kind, key)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    part = parts[kind][key] = {
+                        'path': path, 'tmp': path + '.tmp', 'file': None,
+                        'hash': hashlib.sha256(), 'stories': 0, 'bytes': 0, 'newest': 0.0,
+                    }
+                    # Clear out any temporary file left by an interrupted run
+                    open(part['tmp'], 'w').close()
+                if kind == 'date' and part is not open_day:
+                    if open_day is not None:
+                        _partition_close(open_day)
+                    open_day = part
+                _partition_open(part)
+                _partition_write(part, ('[' if part['stories'] == 0 else ',') + '\n  ' + fetch_news._dump_story(story, '  '))
+                part['stories'] += 1
+                part['newest'] = max(part['newest'], epoch)
+            yield story
+
+        entries = {}
+        for kind in PARTITION_KINDS:
+            entries[kind] = {}
+            for key, part in parts[kind].items():
+                _partition_open(part)
+                _partition_write(part, '\n]')
+                _partition_close(part)
+                sha = part['hash'].hexdigest()
+                changed = previous.get(kind, {}).get(key, {}).get('sha256') != sha or not os.path.exists(part['path'])
+                if changed:
+                    os.replace(part['tmp'], part['path'])
+                else:
+                    os.remove(part['tmp'])
+
+                xml_file = part['path'][:-len('.json')] + '.xml'
+                if feed_title and (changed or not os.path.exists(xml_file)):
+                    write_rss_feed(fetch_news.iter_stories(part['path']), xml_file,
+                                   f"{feed_title}: {key}", f"{feed_title} stories for {key}",
+                                   _iso_utc(part['newest']), _site_path(xml_file))
+                entries[kind][key] = {
+                    'file': _site_path(part['path']),
+                    'stories': part['stories'],
+                    'bytes': part['bytes'],
+                    'sha256': sha,
+                }
+
+        # Remove partitions that no longer have any stories
+        for kind in PARTITION_KINDS:
+            for key, old in previous.get(kind, {}).items():
+                if key not in entries[kind] and old.get('file', '').endswith('.json'):
+                    stale = os.path.join(fetch_news.DATA_DIR, old['file'])
+                    for path in (stale, stale[:-len('.json')] + '.xml'):
+                        if os.path.isfile(path):
+                            os.remove(path)
+
+        manifest[name] = {
+            'source': dict(sorted(entries['source'].items())),
+            'date': dict(sorted(entries['date'].items(), reverse=True)),
+        }
+        changed = sum(1 for kind in PARTITION_KINDS for key, entry in entries[kind].items()
+                      if previous.get(kind, {}).get(key, {}).get('sha256') != entry['sha256'])
+        print(f"Partitioned {name} into {len(entries['source'])} sources and {len(entries['date'])} days "
+              f"({changed} changed)")
+    finally:
+        for kind in PARTITION_KINDS:
+            for part in parts[kind].values():
+                _partition_close(part)
+                if os.path.exists(part['tmp']):
+                    os.remove(part['tmp'])
+
+
+def save_partition_manifest(manifest):
+    """Write the partition manifest, leaving the file alone if it is unchanged."""
+    os.makedirs(fetch_news.PARTITION_DIR, exist_ok=True)
+    fetch_news.write_atomic(fetch_news.PARTITION_MANIFEST_FILE, json.dumps(manifest, indent=2))
+
+
+def main(partition_rss=False):
     # Paths
     data_dir = "docs"
     good_news_json = os.path.join(data_dir, "good_news.json")
     old_news_json = os.path.join(data_dir, "old_news.json")
     good_news_xml = os.path.join(data_dir, "good_news.xml")
     old_news_xml = os.path.join(data_dir, "old_news.xml")
+    good_title = "Ramah: Good News Feed"
+    old_title = "Ramah: Archived Good News"
+    manifest = _load_partition_manifest()
     
+    if fetch_news.STORAGE_BACKEND == 'sqlite':
+        # Build both feeds straight from queries on the SQLite store
+        conn = fetch_news.db_connect()
+        last_run = fetch_news.db_last_run(conn)
+        write_rss_feed(partitioned(fetch_news.db_iter_stories(conn), 'good_news', manifest,
+                                   good_title if partition_rss else None),
+                       good_news_xml, good_title,
+                       "Positive news stories from around the world, filtered by sentiment analysis",
+                       last_run)
+        write_rss_feed(partitioned(fetch_news.db_iter_stories(conn, archived=True), 'old_news', manifest,
+                                   old_title if partition_rss else None),
+                       old_news_xml, old_title,
+                       "Archived positive news stories from the Ramah collection")
+        conn.close()
+        save_partition_manifest(manifest)
+        return
+
     # Generate RSS feeds
     generate_rss_feed(
         good_news_json,
         good_news_xml,
-        "Ramah: Good News Feed",
-        "Positive news stories from around the world, filtered by sentiment analysis"
+        good_title,
+        "Positive news stories from around the world, filtered by sentiment analysis",
+        manifest,
+        partition_rss
     )
     
     generate_rss_feed(
         old_news_json,
         old_news_xml,
-        "Ramah: Archived Good News",
-        "Archived positive news stories from the Ramah collection"
+        old_title,
+        "Archived positive news stories from the Ramah collection",
+        manifest,
+        partition_rss
     )
+    save_partition_manifest(manifest)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate RSS feeds from the stored JSON news files.")
+    parser.add_argument('--partition-rss', action='store_true',
+                        help=f"also write an RSS feed for every partition in {fetch_news.PARTITION_DIR}")
+    parser.add_argument('--profile', action='store_true',
+                        help=f"write CPU and memory profiles to {fetch_news.PROFILE_DIR} (or set RAMAH_PROFILE=1)")
+    args = parser.parse_args()
+    if fetch_news.profiling_requested(args.profile):
+        fetch_news.enable_profiling()
+    try:
+        main(args.partition_rss)
+    finally:
+        fetch_news.write_profile_report('rss')
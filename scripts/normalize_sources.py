@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Normalize `source` fields in `docs/good_news.json` using the
 `canonical_source` function from `scripts.fetch_news`.
+
+Only stories added since the last run are checked unless `SOURCE_MAP` has
+changed since then (or `--full` is given), in which case every story is.
 """
-import json
+import argparse
 import os
 import importlib.util
 import pathlib
@@ -16,33 +19,102 @@ spec.loader.exec_module(fetch_news)
 DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'docs', 'good_news.json')
 DATA_FILE = os.path.normpath(DATA_FILE)
 
+# The fetch_news settings this pass applies; a change triggers a full rescan.
+NORMALIZE_RULES = ['SOURCE_MAP']
 
-def main():
-    if not os.path.exists(DATA_FILE):
-        print(f"No {DATA_FILE} found; nothing to do.")
-        return
 
-    # Load via fetch_news helper to handle both legacy (list) and wrapped
-    # formats that contain 'last run' and 'stories'.
-    data = fetch_news.load_data(DATA_FILE)
+def _canonical(item):
+    return fetch_news.canonical_source(item.get('link', ''), item.get('source'), item.get('link', ''))
 
-    changed = 0
-    for item in data:
+
+def _normalized(stories, full, validated):
+    for item in stories:
+        if full or item.get('link') not in validated:
+            item['source'] = _canonical(item)
+        yield item
+
+
+def _state_file():
+    # Kept next to the data file so pointing DATA_FILE elsewhere keeps the
+    # state with it.
+    return os.path.join(os.path.dirname(DATA_FILE), os.path.basename(fetch_news.VALIDATION_STATE_FILE))
+
+
+def _main_sqlite(fingerprint, full, validated):
+    conn = fetch_news.db_connect()
+    updated = []
+    links = []
+    for item in fetch_news.db_iter_stories(conn):
+        links.append(item.get('link'))
+        if not full and item.get('link') in validated:
+            continue
         old = item.get('source')
-        new = fetch_news.canonical_source(item.get('link', ''), old, item.get('link', ''))
+        new = _canonical(item)
         if new != old:
             print(f"Updating source for {item.get('link')}:\n  '{old}' -> '{new}'")
             item['source'] = new
-            changed += 1
+            updated.append(item)
+
+    if updated:
+        fetch_news.db_update_stories(conn, updated)
+        fetch_news.db_export(conn, archive=False)
+        print(f"Wrote {len(updated)} updated entries to {fetch_news.SQLITE_FILE}.")
+    else:
+        print("No changes needed.")
+    fetch_news.save_validation_state('normalize', fingerprint, links, _state_file())
+    conn.close()
+
+
+def main(full=False):
+    fingerprint = fetch_news.rules_fingerprint(NORMALIZE_RULES)
+    recorded, validated = fetch_news.load_validation_state('normalize', _state_file())
+    full = full or recorded != fingerprint
+
+    if fetch_news.STORAGE_BACKEND == 'sqlite':
+        _main_sqlite(fingerprint, full, validated)
+        return
+
+    if not os.path.exists(DATA_FILE):
+        print(f"No {DATA_FILE} found; nothing to do.")
+        return
+
+    # Stream via fetch_news helper to handle both legacy (list) and wrapped
+    # formats that contain 'last run' and 'stories' without holding the
+    # whole file in memory. The file is only rewritten if something changed.
+    changed = 0
+    links = []
+    try:
+        for item in fetch_news.iter_stories(DATA_FILE):
+            links.append(item.get('link'))
+            if not full and item.get('link') in validated:
+                continue
+            old = item.get('source')
+            new = _canonical(item)
+            if new != old:
+                print(f"Updating source for {item.get('link')}:\n  '{old}' -> '{new}'")
+                changed += 1
+    except ValueError as e:
+        print(f"Could not read {DATA_FILE}: {e}")
+        return
 
     if changed:
-        # Use fetch_news.save_data so we preserve any existing 'last run'
+        # Use fetch_news.save_data_stream so we preserve any existing 'last run'
         # metadata and remain compatible with the wrapped format.
-        fetch_news.save_data(data, DATA_FILE)
+        fetch_news.save_data_stream(_normalized(fetch_news.iter_stories(DATA_FILE), full, validated), DATA_FILE)
         print(f"Wrote {changed} updated entries to {DATA_FILE}.")
     else:
         print("No changes needed.")
+    fetch_news.save_validation_state('normalize', fingerprint, links, _state_file())
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Normalize stored source names.")
+    parser.add_argument('--full', action='store_true', help="check every story even if SOURCE_MAP is unchanged")
+    args = parser.parse_args()
+    if fetch_news.profiling_requested():
+        fetch_news.enable_profiling()
+    try:
+        with fetch_news.profile_stage('normalize', snapshot=True):
+            main(full=args.full)
+    finally:
+        fetch_news.write_profile_report('normalize')
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""What-if analysis for `SENTIMENT_THRESHOLD`, score weighting and `BLOCK_LIST`.
+
+Loads the stored VADER/TextBlob scores of every story in `docs/good_news.json`
+and the archive into columnar numpy arrays and evaluates a whole grid of
+scenarios in one vectorized pass:
+
+- thresholds (`--thresholds 0.3,0.4,0.5`)
+- VADER weights, where the score is w * VADER + (1 - w) * TextBlob and the
+  current rule is the plain mean, w = 0.5 (`--vader-weights 0.5,0.7`)
+- block-list edits (`--add-block royal --remove-block cricket`), each tried
+  on its own and all together
+
+For each scenario it prints how many stories each source would keep and
+lose. Stories were already filtered when they were fetched, so this shows
+the effect of tightening the filters, not of loosening them. Nothing is
+modified.
+
+Requires numpy (`pip3 install numpy`), which the fetcher itself does not need.
+"""
+import argparse
+import csv
+import importlib.util
+import pathlib
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    sys.exit("what_if.py needs numpy: pip3 install numpy")
+
+# Load fetch_news as a module by file path so we don't rely on package imports.
+fetch_news_path = pathlib.Path(__file__).resolve().parent / 'fetch_news.py'
+spec = importlib.util.spec_from_file_location('fetch_news', str(fetch_news_path))
+fetch_news = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(fetch_news)
+
+
+def load_columns(include_archive=True):
+    """Read stored stories into a dict of parallel numpy arrays."""
+    if fetch_news.STORAGE_BACKEND == 'sqlite':
+        conn = fetch_news.db_connect()
+        sources = [fetch_news.db_iter_stories(conn)]
+        if include_archive:
+            sources.append(fetch_news.db_iter_stories(conn, archived=True))
+    else:
+        sources = [fetch_news.iter_stories(fetch_news.DATA_FILE)]
+        if include_archive:
+            sources.append(fetch_news.iter_stories(fetch_news.ARCHIVE_FILE))
+
+    headlines, links, publishers, vader, textblob = [], [], [], [], []
+    for stories in sources:
+        for story in stories:
+            mean = story.get('mean_score', 0)
+            headlines.append(story.get('headline', '').lower())
+            links.append(story.get('link', '') or '')
+            publishers.append(story.get('source', 'Unknown Source'))
+            vader.append(story.get('vader_score', mean))
+            textblob.append(story.get('textblob_score', mean))
+
+    source_names, source_codes = np.unique(np.array(publishers, dtype=str), return_inverse=True)
+    return {
+        'headline': np.array(headlines, dtype=str),
+        'link': np.array(links, dtype=str),
+        'vader': np.array(vader, dtype=float),
+        'textblob': np.array(textblob, dtype=float),
+        'source_names': source_names,
+        'source_codes': source_codes.reshape(-1),
+    }
+
+
+def block_variants(add=(), remove=()):
+    """Return [(label, word list)] for the current block list and each edit."""
+    current = list(fetch_news.BLOCK_LIST)
+    removed = {w.lower() for w in remove}
+    variants = [('current', current)]
+    for word in add:
+        variants.append((f'+{word}', current + [word]))
+    for word in remove:
+        variants.append((f'-{word}', [w for w in current if w.lower() != word.lower()]))
+    if len(add) + len(remove) > 1:
+        variants.append(('all edits', [w for w in current if w.lower() not in removed] + list(add)))
+    return variants
+
+
+def evaluate(columns, thresholds, weights, variants):
+    """Evaluate every (weight, threshold, block variant) scenario at once.
+
+    Returns an int array of kept counts shaped (weights, thresholds,
+    variants, sources) and the per-source story totals.
+    """
+    n = len(columns['headline'])
+    n_sources = len(columns['source_names'])
+    thresholds = np.asarray(thresholds, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+
+    # One column per distinct block word: does the headline contain it?
+    words = sorted({w.lower() for _, variant in variants for w in variant})
+    contains = np.empty((n, len(words)), dtype=bool)
+    for j, word in enumerate(words):
+        contains[:, j] = np.char.find(columns['headline'], word) >= 0
+
+    # Variant membership of each word, so blocked = any(contains & member)
+    word_index = {w: j for j, w in enumerate(words)}
+    member = np.zeros((len(words), len(variants)), dtype=np.int32)
+    for k, (_, variant) in enumerate(variants):
+        for w in variant:
+            member[word_index[w.lower()], k] = 1
+    blocked = (contains.astype(np.int32) @ member) > 0  # (n, variants)
+
+    url_blocked = np.zeros(n, dtype=bool)
+    for block in fetch_news.URL_BLOCKLIST:
+        url_blocked |= np.char.find(columns['link'], block) >= 0
+    allowed = ~(blocked | url_blocked[:, None])  # (n, variants)
+
+    scores = columns['vader'][:, None] * weights + columns['textblob'][:, None] * (1 - weights)  # (n, weights)
+    passes = scores[:, :, None] > thresholds  # (n, weights, thresholds)
+    kept = passes[:, :, :, None] & allowed[:, None, None, :]  # (n, weights, thresholds, variants)
+
+    # Sum kept stories per source with a one-hot matrix product
+    one_hot = np.zeros((n, n_sources), dtype=np.int32)
+    one_hot[np.arange(n), columns['source_codes']] = 1
+    counts = one_hot.T @ kept.reshape(n, -1).astype(np.int32)  # (sources, scenarios)
+    counts = counts.T.reshape(len(weights), len(thresholds), len(variants), n_sources)
+    return counts, one_hot.sum(axis=0)
+
+
+def _floats(text):
+    return [float(x) for x in text.split(',') if x.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate threshold, weighting and block-list changes against stored stories.")
+    parser.add_argument('--thresholds', type=_floats,
+                        default=sorted({fetch_news.SENTIMENT_THRESHOLD, 0.4, 0.5}),
+                        help="comma-separated sentiment thresholds (default: current, 0.4, 0.5)")
+    parser.add_argument('--vader-weights', type=_floats, default=[0.5],
+                        help="comma-separated VADER weights; 0.5 is the current plain mean")
+    parser.add_argument('--add-block', action='append', default=[], metavar='WORD',
+                        help="candidate block-list addition (repeatable)")
+    parser.add_argument('--remove-block', action='append', default=[], metavar='WORD',
+                        help="candidate block-list removal (repeatable)")
+    parser.add_argument('--no-archive', action='store_true', help="only analyse docs/good_news.json")
+    parser.add_argument('--csv', metavar='PATH', help="also write one row per scenario and source to PATH")
+    args = parser.parse_args(argv)
+
+    columns = load_columns(include_archive=not args.no_archive)
+    variants = block_variants(args.add_block, args.remove_block)
+    counts, totals = evaluate(columns, args.thresholds, args.vader_weights, variants)
+    names = list(columns['source_names'])
+
+    print(f"{len(columns['headline'])} stories. Cells show kept/removed.")
+    header = ['weight', 'threshold', 'block list'] + names + ['total']
+    rows = []
+    for wi, weight in enumerate(args.vader_weights):
+        for ti, threshold in enumerate(args.thresholds):
+            for vi, (label, _) in enumerate(variants):
+                kept = counts[wi, ti, vi]
+                cells = [f"{k}/{t - k}" for k, t in zip(kept, totals)]
+                cells.append(f"{kept.sum()}/{totals.sum() - kept.sum()}")
+                rows.append([f"{weight:g}", f"{threshold:g}", label] + cells)
+
+    widths = [max(len(str(r[i])) for r in [header] + rows) for i in range(len(header))]
+    for r in [header] + rows:
+        print('  '.join(str(c).ljust(w) for c, w in zip(r, widths)))
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['vader_weight', 'threshold', 'block_list', 'source', 'kept', 'removed'])
+            for wi, weight in enumerate(args.vader_weights):
+                for ti, threshold in enumerate(args.thresholds):
+                    for vi, (label, _) in enumerate(variants):
+                        for si, name in enumerate(names):
+                            kept = int(counts[wi, ti, vi, si])
+                            writer.writerow([weight, threshold, label, name, kept, int(totals[si]) - kept])
+        print(f"Wrote {args.csv}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import json
+import os
+import importlib.util
+
+import pytest
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+
+def test_identical_content_is_not_rewritten(tmp_path):
+    p = tmp_path / "out.json"
+    assert m.write_atomic(str(p), '{"a": 1}') is True
+    os.utime(p, (0, 0))
+    m._file_digests.clear()  # as if a new process were writing
+
+    assert m.write_atomic(str(p), ['{"a"', ': 1}']) is False
+    assert p.stat().st_mtime == 0
+    assert m.write_atomic(str(p), '{"a": 2}') is True
+    assert p.read_text() == '{"a": 2}'
+    assert os.listdir(tmp_path) == ['out.json']
+
+
+def test_failed_write_keeps_old_file(tmp_path):
+    p = tmp_path / "out.json"
+    p.write_text('old')
+
+    def chunks():
+        yield 'new, but'
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        m.write_atomic(str(p), chunks())
+    assert p.read_text() == 'old'
+    assert os.listdir(tmp_path) == ['out.json']
+
+
+def test_save_data_unchanged_wrapped_file_is_left_alone(tmp_path):
+    p = tmp_path / "good_news.json"
+    stories = [{'headline': 'h', 'link': 'l', 'timestamp': '2026-01-01T00:00:00Z'}]
+    m.save_data(stories, str(p), last_run="2026-01-03T12:00:00Z")
+    os.utime(p, (0, 0))
+
+    # No last_run: the stored one is kept, so the content is identical
+    m.save_data(stories, str(p))
+    assert p.stat().st_mtime == 0
+    assert json.loads(p.read_text())['last run'] == "2026-01-03T12:00:00Z"
+
+    m.save_data_stream(iter(stories), str(p))
+    assert p.stat().st_mtime == 0
@@ -0,0 +1,76 @@
+import importlib.util
+import time
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+
+class _Entry(dict):
+    @property
+    def published_parsed(self):
+        return self['published_parsed']
+
+
+class _Feed:
+    def __init__(self, epochs):
+        self.entries = [_Entry(published_parsed=time.gmtime(e)) for e in epochs]
+
+
+def test_poll_interval_follows_publish_cadence():
+    hourly = _Feed([1_700_000_000 - 3600 * i for i in range(10)])
+    assert m.learn_poll_interval(hourly) == 3600
+
+
+def test_poll_interval_is_clamped_and_smoothed():
+    rare = _Feed([1_700_000_000 - 86400 * i for i in range(5)])
+    assert m.learn_poll_interval(rare) == m.DAEMON_MAX_INTERVAL
+    assert m.learn_poll_interval(rare, previous=3600) == (3600 + m.DAEMON_MAX_INTERVAL) // 2
+
+
+def test_poll_interval_without_dates_keeps_previous():
+    assert m.learn_poll_interval(_Feed([]), previous=1234) == 1234
+    assert m.learn_poll_interval(_Feed([])) == m.DAEMON_DEFAULT_INTERVAL
+
+
+def test_sigterm_during_flush_does_not_flush_twice(monkeypatch):
+    import os
+    import signal
+
+    flushed = []
+
+    def fake_finish_run(state):
+        os.kill(os.getpid(), signal.SIGTERM)  # arrives mid-write
+        flushed.append(state)
+
+    def fake_process_feeds(state, urls):
+        state['metrics']['feeds_checked'] += len(urls)
+        return {}
+
+    monkeypatch.setattr(m, 'RSS_FEEDS', ['https://example.com/feed'])
+    monkeypatch.setattr(m, 'start_run', lambda analyzer: {'metrics': m._new_metrics()})
+    monkeypatch.setattr(m, 'process_feeds', fake_process_feeds)
+    monkeypatch.setattr(m, 'finish_run', fake_finish_run)
+    scripts_runs = []
+    monkeypatch.setattr(m, 'run_flush_scripts', lambda: scripts_runs.append(1))
+    monkeypatch.setattr(m, 'score_headlines', lambda *a: {})
+    previous = signal.getsignal(signal.SIGTERM)
+
+    m.run_daemon(flush_interval=0)
+
+    assert len(flushed) == 1
+    # The rest of the pipeline ran after the flush, despite the signal
+    assert scripts_runs == [1]
+    assert signal.getsignal(signal.SIGTERM) is previous
+
+
+def test_flush_scripts_run_in_order_and_survive_failures(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd[-1].rsplit('/', 1)[-1])
+        return m.subprocess.CompletedProcess(cmd, 1 if len(calls) == 1 else 0, stderr='boom')
+
+    monkeypatch.setattr(m.subprocess, 'run', fake_run)
+    m.run_flush_scripts()
+    assert calls == ['cleanup_news.py', 'normalize_sources.py', 'generate_rss.py']
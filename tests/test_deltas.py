@@ -0,0 +1,62 @@
+import json
+import importlib.util
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+
+def _point_at(tmp_path):
+    m.DATA_DIR = str(tmp_path)
+    m.DELTA_DIR = str(tmp_path / "deltas")
+    m.DELTA_INDEX_FILE = str(tmp_path / "deltas" / "index.json")
+
+
+def test_write_delta_and_index(tmp_path):
+    _point_at(tmp_path)
+    added = [{'headline':'h','link':'l1','timestamp':'2026-01-02T00:00:00Z'}]
+    archived = [{'headline':'old','link':'l0','timestamp':'2025-12-01T00:00:00Z'}]
+
+    m.write_delta('2026-01-02T03:00:00Z', '2026-01-02T00:00:00Z', added, archived)
+
+    index = json.loads((tmp_path / "deltas" / "index.json").read_text())
+    assert index['last run'] == '2026-01-02T03:00:00Z'
+    entry = index['deltas'][0]
+    assert entry['since'] == '2026-01-02T00:00:00Z'
+    assert entry['file'] == 'deltas/20260102T030000Z.json'
+    assert entry['added'] == 1 and entry['archived'] == 1
+
+    delta = json.loads((tmp_path / entry['file']).read_text())
+    assert delta['added'] == added
+    assert delta['archived'] == ['l0']
+    assert delta['removed'] == []
+
+
+def test_delta_index_is_capped(tmp_path):
+    _point_at(tmp_path)
+    original_max = m.MAX_DELTAS
+    m.MAX_DELTAS = 2
+    runs = ['2026-01-01T00:00:00Z', '2026-01-01T03:00:00Z', '2026-01-01T06:00:00Z']
+    since = None
+    try:
+        for lr in runs:
+            m.write_delta(lr, since, [], [])
+            since = lr
+    finally:
+        m.MAX_DELTAS = original_max
+
+    index = json.loads((tmp_path / "deltas" / "index.json").read_text())
+    assert [e['last run'] for e in index['deltas']] == runs[:0:-1]
+    assert not (tmp_path / "deltas" / "20260101T000000Z.json").exists()
+
+
+def test_record_delta_removals(tmp_path):
+    _point_at(tmp_path)
+    m.write_delta('2026-01-02T03:00:00Z', None, [{'link':'l1'}, {'link':'l2'}], [])
+
+    m.record_delta_removals('2026-01-02T03:00:00Z', ['l2'])
+
+    delta = json.loads((tmp_path / "deltas" / "20260102T030000Z.json").read_text())
+    assert delta['removed'] == ['l2']
+    index = json.loads((tmp_path / "deltas" / "index.json").read_text())
+    assert index['deltas'][0]['removed'] == 1
@@ -0,0 +1,80 @@
+import importlib.util
+import types
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+
+class FakeResponse:
+    def __init__(self, body, content_type, declared_length=None):
+        self.body = body
+        self.headers = {'Content-Type': content_type}
+        if declared_length is not None:
+            self.headers['Content-Length'] = str(declared_length)
+        self.chunks_read = 0
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            self.chunks_read += 1
+            yield self.body[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+def _serve(response):
+    m._http_session = types.SimpleNamespace(get=lambda *a, **k: response)
+
+
+RSS = b"<rss><channel><title>T</title><item><title>Hello</title><link>https://x/1</link></item></channel></rss>"
+ARTICLE = b"<html><p>Volunteers planted ten thousand trees along the river this spring.</p></html>"
+
+
+def test_feed_within_limits_is_parsed():
+    _serve(FakeResponse(RSS, 'application/rss+xml; charset=utf-8'))
+    metrics = m._new_metrics()
+    feed = m.fetch_feed_with_retry('https://x/feed', metrics=metrics)
+    assert feed.entries[0].title == 'Hello'
+    assert metrics['feeds_oversized'] == metrics['feeds_rejected'] == 0
+
+
+def test_oversized_feed_stops_reading_and_is_not_retried(monkeypatch):
+    monkeypatch.setattr(m, 'MAX_FEED_BYTES', 3 * m.STREAM_CHUNK_SIZE)
+    response = FakeResponse(b'x' * (10 * m.STREAM_CHUNK_SIZE), 'text/xml')
+    _serve(response)
+    metrics = m._new_metrics()
+    assert m.fetch_feed_with_retry('https://x/feed', initial_delay=60, metrics=metrics) is None
+    assert metrics['feeds_oversized'] == 1
+    assert response.chunks_read == 4 and response.closed
+
+
+def test_declared_length_is_rejected_before_reading():
+    response = FakeResponse(ARTICLE, 'text/html', declared_length=m.MAX_ARTICLE_BYTES + 1)
+    _serve(response)
+    metrics = m._new_metrics()
+    assert m.get_first_sentence('https://x/a', metrics=metrics) is None
+    assert metrics['articles_oversized'] == 1
+    assert response.chunks_read == 0
+
+
+def test_wrong_content_type_is_rejected():
+    _serve(FakeResponse(b'%PDF-1.4', 'application/pdf'))
+    metrics = m._new_metrics()
+    assert m.get_first_sentence('https://x/a.pdf', metrics=metrics) is None
+    assert metrics['articles_rejected'] == 1
+
+    # Substrings of an allowed type are not enough
+    _serve(FakeResponse(b'PK', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'))
+    assert m.fetch_feed_with_retry('https://x/feed.docx', metrics=metrics) is None
+    assert metrics['feeds_rejected'] == 1
+
+    _serve(FakeResponse(RSS, 'application/atom+xml'))
+    assert m.fetch_feed_with_retry('https://x/feed', metrics=metrics).entries
+
+    _serve(FakeResponse(ARTICLE, 'text/html; charset=utf-8'))
+    assert m.get_first_sentence('https://x/a', metrics=metrics).startswith('Volunteers planted')
@@ -0,0 +1,75 @@
+import importlib.util
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+BBC_PAGE = """<html><body>
+<p>The day starts with a gentle trek through the hills above the village.</p>
+<article>
+  <div data-component="text-block"><p>Scientists have restored a wetland that was drained a century ago. It now hosts rare birds.</p></div>
+</article>
+</body></html>"""
+
+
+def test_publisher_extractor_skips_page_chrome():
+    sentence, via_extractor = m.extract_first_sentence(BBC_PAGE, 'https://www.bbc.com/news/articles/abc')
+    assert sentence == 'Scientists have restored a wetland that was drained a century ago.'
+    assert via_extractor
+
+
+def test_unknown_host_uses_generic_rule():
+    sentence, via_extractor = m.extract_first_sentence(BBC_PAGE, 'https://example.com/story')
+    assert sentence == 'The day starts with a gentle trek through the hills above the village.'
+    assert not via_extractor
+
+
+def test_extractor_falls_back_when_container_missing():
+    page = "<p>Copyright notice that is long enough to otherwise count as a sentence.</p><p>A community garden has doubled its harvest thanks to volunteers.</p>"
+    sentence, via_extractor = m.extract_first_sentence(page, 'https://www.npr.org/2026/01/01/story')
+    assert sentence == 'A community garden has doubled its harvest thanks to volunteers.'
+    assert not via_extractor
+
+
+def test_extraction_stats_summary():
+    stats = {}
+    m._record_extraction(stats, 'https://www.theguardian.com/a', 'Sentence.', True, 0.2)
+    m._record_extraction(stats, 'https://www.theguardian.com/b', None, False, 0.4)
+    m._record_extraction(stats, 'https://www.theguardian.com/c', None, False)  # download failed
+    summary = m.summarize_extraction_stats(stats)
+    assert summary['The Guardian']['attempts'] == 3
+    assert summary['The Guardian']['fetch_failures'] == 1
+    assert summary['The Guardian']['success_rate'] == 0.33
+    assert summary['The Guardian']['via_extractor'] == 1
+    # The failed download is not averaged in as a 0-second extraction
+    assert summary['The Guardian']['avg_extract_seconds'] == 0.3
+
+
+def test_score_sentence():
+    good = 'Volunteers planted ten thousand trees along the river this spring.'
+    assert m.score_sentence(good) == 1.0
+    assert m.score_sentence('Read more about this story here and elsewhere...') < 0.8
+    assert m.score_sentence('') == 0.0
+
+
+def test_boilerplate_and_headline_repeats_never_pass():
+    threshold = min(m.FEED_SUMMARY_MIN_SCORE.values())
+    good = 'Volunteers planted ten thousand trees along the river this spring.'
+    assert m.score_sentence(good, headline=good) < threshold
+    assert m.score_sentence('Read more: the council says the new park will open to the public next year.') < threshold
+    assert m.score_sentence('Copyright 2026 Guardian News and Media Limited or its affiliated companies.') < threshold
+
+    entry = {'summary': '<p>Copyright 2026 Guardian News and Media Limited or its affiliated companies.</p>'}
+    sentence, score = m.sentence_from_entry(entry)
+    assert sentence is None and score < threshold
+
+
+def test_sentence_from_entry_prefers_content():
+    entry = {
+        'title': 'Trees return to the river',
+        'summary': '<p>Short teaser</p>',
+        'content': [{'value': '<p>Volunteers planted ten thousand trees along the river this spring. It took months.</p>'}],
+    }
+    sentence, score = m.sentence_from_entry(entry)
+    assert sentence == 'Volunteers planted ten thousand trees along the river this spring.'
+    assert score >= m.FEED_SUMMARY_MIN_SCORE['The Guardian']
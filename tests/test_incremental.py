@@ -0,0 +1,51 @@
+import json
+import importlib.util
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+
+def test_rules_fingerprint_tracks_rule_changes():
+    before = m.rules_fingerprint(['BLOCK_LIST', 'SENTIMENT_THRESHOLD'])
+    assert before == m.rules_fingerprint(['SENTIMENT_THRESHOLD', 'BLOCK_LIST'])
+
+    original = m.SENTIMENT_THRESHOLD
+    m.SENTIMENT_THRESHOLD = original + 0.1
+    try:
+        assert m.rules_fingerprint(['BLOCK_LIST', 'SENTIMENT_THRESHOLD']) != before
+    finally:
+        m.SENTIMENT_THRESHOLD = original
+
+
+def test_validation_state_round_trip(tmp_path):
+    state_file = str(tmp_path / "validation_state.json")
+    assert m.load_validation_state('cleanup', state_file) == (None, set())
+
+    m.save_validation_state('cleanup', 'abc', ['l2', 'l1'], state_file)
+    m.save_validation_state('normalize', 'def', ['l1'], state_file)
+
+    assert m.load_validation_state('cleanup', state_file) == ('abc', {'l1', 'l2'})
+    assert json.loads((tmp_path / "validation_state.json").read_text())['normalize']['validated'] == ['l1']
+
+
+def test_normalize_only_checks_new_stories(tmp_path):
+    p = tmp_path / "good_news.json"
+    stories = [{'headline':'h','link':'https://www.bbc.co.uk/news/1', 'source':'BBC News', 'timestamp':'2026-01-01T00:00:00Z'}]
+    p.write_text(json.dumps({'last run': '2026-01-01T00:00:00Z', 'stories': stories}, indent=2))
+
+    spec_ns = importlib.util.spec_from_file_location('normalize_sources','scripts/normalize_sources.py')
+    ns = importlib.util.module_from_spec(spec_ns)
+    spec_ns.loader.exec_module(ns)
+    ns.DATA_FILE = str(p)
+    ns.main()
+
+    # A story already validated under the same SOURCE_MAP is left alone...
+    stories[0]['source'] = 'Bad'
+    p.write_text(json.dumps({'last run': '2026-01-01T00:00:00Z', 'stories': stories}, indent=2))
+    ns.main()
+    assert json.loads(p.read_text())['stories'][0]['source'] == 'Bad'
+
+    # ...until a full rescan is requested or the rules change
+    ns.main(full=True)
+    assert json.loads(p.read_text())['stories'][0]['source'] == 'BBC News'
@@ -0,0 +1,104 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+spec = importlib.util.spec_from_file_location('generate_rss','scripts/generate_rss.py')
+gr = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gr)
+
+
+def _story(n, source, day):
+    return {'headline': f'Story {n}', 'link': f'https://example.com/{n}', 'source': source,
+            'timestamp': f'{day}T0{n % 10}:00:00Z'}
+
+
+def _run(tmp_path, stories, manifest, feed_title=None):
+    fn = gr.fetch_news
+    fn.DATA_DIR = str(tmp_path)
+    fn.PARTITION_DIR = str(tmp_path / 'partitions')
+    fn.PARTITION_MANIFEST_FILE = str(tmp_path / 'partitions' / 'manifest.json')
+    passed = list(gr.partitioned(iter(stories), 'good_news', manifest, feed_title))
+    assert passed == stories
+    gr.save_partition_manifest(manifest)
+    return manifest['good_news']
+
+
+def test_partitions_by_source_and_day(tmp_path):
+    stories = [_story(3, 'BBC News', '2026-01-02'), _story(2, 'NPR News', '2026-01-02'),
+               _story(1, 'BBC News', '2026-01-01')]
+    entries = _run(tmp_path, stories, {}, feed_title='Ramah')
+
+    assert list(entries['source']) == ['BBC News', 'NPR News']
+    assert list(entries['date']) == ['2026-01-02', '2026-01-01']
+    bbc = tmp_path / entries['source']['BBC News']['file']
+    assert bbc == tmp_path / 'partitions' / 'good_news' / 'source' / 'bbc-news.json'
+    assert json.loads(bbc.read_text()) == [stories[0], stories[2]]
+    assert entries['source']['BBC News']['bytes'] == bbc.stat().st_size
+    assert list(gr.fetch_news.iter_stories(str(bbc))) == [stories[0], stories[2]]
+    assert (tmp_path / 'partitions' / 'good_news' / 'date' / '2026-01-02.xml').exists()
+    assert not list(tmp_path.rglob('*.tmp'))
+
+
+def test_only_changed_partitions_are_rewritten(tmp_path):
+    stories = [_story(2, 'NPR News', '2026-01-02'), _story(1, 'BBC News', '2026-01-01')]
+    manifest = {}
+    _run(tmp_path, stories, manifest)
+    bbc = tmp_path / 'partitions' / 'good_news' / 'source' / 'bbc-news.json'
+    npr = tmp_path / 'partitions' / 'good_news' / 'source' / 'npr-news.json'
+    os.utime(bbc, (0, 0))
+    os.utime(npr, (0, 0))
+
+    # NPR gets a new story; BBC is untouched and the 2026-01-02 day disappears
+    stories = [_story(4, 'NPR News', '2026-01-03'), _story(1, 'BBC News', '2026-01-01')]
+    entries = _run(tmp_path, stories, json.loads((tmp_path / 'partitions' / 'manifest.json').read_text()))
+
+    assert bbc.stat().st_mtime == 0
+    assert npr.stat().st_mtime != 0
+    assert list(entries['date']) == ['2026-01-03', '2026-01-01']
+    assert not (tmp_path / 'partitions' / 'good_news' / 'date' / '2026-01-02.json').exists()
+
+
+def test_out_of_order_days_are_appended(tmp_path):
+    stories = [_story(3, 'BBC News', '2026-01-02'), _story(2, 'BBC News', '2026-01-01'),
+               _story(1, 'BBC News', '2026-01-02')]
+    entries = _run(tmp_path, stories, {})
+    day = tmp_path / entries['date']['2026-01-02']['file']
+    assert json.loads(day.read_text()) == [stories[0], stories[2]]
+
+
+@pytest.mark.filterwarnings('error')
+def test_partition_files_are_closed_exactly_once(tmp_path, monkeypatch):
+    handles = []
+
+    def tracking_open(*args, **kwargs):
+        f = open(*args, **kwargs)
+        handles.append(f)
+        return f
+
+    monkeypatch.setattr(gr, 'open', tracking_open, raising=False)
+    stories = [_story(3, 'BBC News', '2026-01-02'), _story(2, 'NPR News', '2026-01-01'),
+               _story(1, 'BBC News', '2026-01-01')]
+    entries = _run(tmp_path, stories, {})
+
+    # Every handle was closed explicitly, never left for garbage collection
+    assert handles and all(f.closed for f in handles)
+    bbc = tmp_path / entries['source']['BBC News']['file']
+    assert json.loads(bbc.read_text()) == [stories[0], stories[2]]
+
+
+def test_days_are_utc_and_newest_compares_epochs(tmp_path):
+    local = {'headline': 'Local', 'link': 'https://example.com/local', 'source': 'ABC News',
+             'timestamp': '2026-01-01T01:01:18+1100'}  # 2025-12-31T14:01:18Z
+    later = {'headline': 'Later', 'link': 'https://example.com/later', 'source': 'ABC News',
+             'timestamp': '2025-12-31T20:00:00Z'}
+    broken = {'headline': 'Broken', 'link': 'https://example.com/x', 'source': 'ABC News', 'timestamp': 'soon'}
+    assert gr.partition_key(local, 'date') == '2025-12-31'
+    assert gr.partition_key(broken, 'date') == 'unknown'
+
+    # As raw strings the +1100 stamp sorts after the later UTC one
+    entries = _run(tmp_path, [local, later], {}, feed_title='Ramah')
+    assert list(entries['date']) == ['2025-12-31']
+    xml = (tmp_path / 'partitions' / 'good_news' / 'source' / 'abc-news.xml').read_text()
+    assert '<lastBuildDate>Wed, 31 Dec 2025 20:00:00 GMT</lastBuildDate>' in xml
@@ -0,0 +1,43 @@
+import importlib.util
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+
+def test_stages_are_recorded_and_reported(tmp_path):
+    m.PROFILE_DIR = str(tmp_path)
+    m.enable_profiling()
+    try:
+        for _ in range(2):
+            with m.profile_stage('score'):
+                sorted(range(1000), reverse=True)
+        with m.profile_stage('save', snapshot=True):
+            with m.profile_stage('block'):  # nested stages count towards the outer one
+                [str(i) for i in range(1000)]
+        stages = m._profile_stages
+        m.write_profile_report('test')
+    finally:
+        m._profile_stages = None
+        m.tracemalloc.stop()
+
+    assert stages['score']['calls'] == 2
+    assert 'block' not in stages
+    assert stages['save']['snapshot'] is not None
+    assert stages['save']['peak_bytes'] > 0
+    assert (tmp_path / 'test-score.prof').exists()
+    summary = (tmp_path / 'test-summary.txt').read_text()
+    assert 'score: 2 calls' in summary
+    assert 'Largest allocations held at the end of save' in summary
+
+
+def test_disabled_profiling_is_a_no_op(tmp_path):
+    m.PROFILE_DIR = str(tmp_path)
+
+    @m.profile_stage('score')
+    def double(x):
+        return 2 * x
+
+    assert double(2) == 4
+    m.write_profile_report('test')
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,50 @@
+import importlib.util
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+BBC = 'http://feeds.bbci.co.uk/news/rss.xml'
+BBC_WORLD = 'http://feeds.bbci.co.uk/news/world/rss.xml'
+NPR = 'https://feeds.npr.org/1001/rss.xml'
+ARS = 'https://feeds.arstechnica.com/arstechnica/index'
+
+
+def test_no_history_keeps_configured_order():
+    assert m.prioritize_feeds([BBC, NPR, ARS], []) == [BBC, NPR, ARS]
+
+
+def test_source_yield_is_split_across_feeds():
+    history = [{'stories_by_source': {'BBC News': 4, 'NPR News': 3}}]
+    # BBC's 4 stories are shared by two feeds (2 each), NPR's 3 by one
+    assert m.prioritize_feeds([BBC, BBC_WORLD, ARS, NPR], history) == [NPR, BBC, BBC_WORLD, ARS]
+
+
+def test_per_feed_yield_and_reliability():
+    history = [
+        {'stories_by_feed': {BBC: 2, NPR: 4}, 'failed_feeds': []},
+        {'stories_by_feed': {BBC: 2}, 'failed_feeds': [NPR]},
+        {'stories_by_feed': {BBC: 2}, 'failed_feeds': [NPR]},
+    ]
+    # NPR yields 4 when it works but fails two runs in three (4 * 1/3 < 2);
+    # the failures are not also counted as runs with no stories
+    assert m.prioritize_feeds([NPR, BBC, ARS], history) == [BBC, NPR, ARS]
+    history[2]['failed_feeds'] = []
+    history[2]['stories_by_feed'][NPR] = 4
+    assert m.prioritize_feeds([BBC, NPR, ARS], history) == [NPR, BBC, ARS]
+
+
+def test_skipped_runs_do_not_lower_yield():
+    history = [
+        {'stories_by_feed': {BBC: 2, NPR: 3}, 'failed_feeds': [], 'feeds_skipped': []},
+        {'stories_by_feed': {BBC: 2}, 'failed_feeds': [], 'feeds_skipped': [NPR]},
+        {'stories_by_feed': {BBC: 2}, 'failed_feeds': [], 'feeds_skipped': [NPR]},
+    ]
+    # NPR was only fetched once, and yielded 3
+    assert m.prioritize_feeds([BBC, NPR], history) == [NPR, BBC]
+
+
+def test_request_timeout_respects_deadline():
+    assert m._request_timeout(None) == m.REQUEST_TIMEOUT
+    assert m._request_timeout(m.time.time() + 3) <= 3
+    assert m._request_timeout(m.time.time() - 5) == 1
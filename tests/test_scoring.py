@@ -0,0 +1,80 @@
+import importlib.util
+
+import feedparser
+from textblob import TextBlob
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+GUARDIAN = 'https://www.theguardian.com/world/rss'
+NPR = 'https://feeds.npr.org/1001/rss.xml'
+
+
+def _rss(items):
+    body = ''.join(f"<item><title>{t}</title><link>{l}</link><description>Summary. More.</description></item>"
+                   for t, l in items)
+    return f"<rss><channel><title>Test</title>{body}</channel></rss>"
+
+
+def test_batch_scores_match_textblob_and_vader():
+    titles = ["Wonderful amazing happy news", "Man killed in crash", "Not bad at all!", "Wonderful amazing happy news"]
+    analyzer = m.SentimentIntensityAnalyzer()
+    scores = m.score_headlines(titles, analyzer)
+    assert len(scores) == 3
+    for title in titles:
+        assert scores[title] == (analyzer.polarity_scores(title)['compound'], TextBlob(title).sentiment.polarity)
+
+
+def test_unpicklable_pool_falls_back_to_in_process(monkeypatch):
+    # This copy of the module is not importable by name, so the pool cannot start
+    monkeypatch.setattr(m, 'SCORE_WORKERS', 2)
+    monkeypatch.setattr(m, 'SCORE_POOL_MIN_HEADLINES', 1)
+    assert m.score_headlines(["A wonderful day"])["A wonderful day"][0] > 0
+
+
+def test_batched_feeds_keep_per_feed_decisions(tmp_path, monkeypatch):
+    monkeypatch.setattr(m, 'DATA_FILE', str(tmp_path / 'good_news.json'))
+    monkeypatch.setattr(m, 'ARCHIVE_FILE', str(tmp_path / 'old_news.json'))
+    monkeypatch.setattr(m, 'SENTENCE_CACHE_FILE', str(tmp_path / 'sentence_cache.json'))
+    feeds = {
+        GUARDIAN: _rss([("Wonderful amazing happy news", "https://www.theguardian.com/a"),
+                        ("Quarterly figures published", "https://www.theguardian.com/b"),
+                        ("Wonderful cricket win", "https://www.theguardian.com/c")]),
+        # The same story again from a second feed, this time with a blocked word
+        NPR: _rss([("Wonderful amazing happy news, says Trump", "https://www.theguardian.com/a")]),
+    }
+    monkeypatch.setattr(m, 'fetch_feed_with_retry', lambda url, **k: feedparser.parse(feeds[url]))
+    monkeypatch.setattr(m, 'get_first_sentence', lambda *a, **k: None)
+
+    state = m.start_run(m.SentimentIntensityAnalyzer())
+    result = m.process_feeds(state, [GUARDIAN, NPR])
+
+    metrics = state['metrics']
+    assert set(result) == {GUARDIAN, NPR}
+    assert [s['link'] for s in state['added_stories']] == ["https://www.theguardian.com/a"]
+    assert metrics['entries_processed'] == 4
+    assert metrics['entries_accepted'] == 1
+    assert metrics['entries_sentiment_rejected'] == 1
+    # The cricket headline is blocked; the NPR duplicate was already accepted
+    assert metrics['entries_blocked'] == 1
+
+
+def test_feed_sentence_is_the_fallback_when_the_article_fetch_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(m, 'DATA_FILE', str(tmp_path / 'good_news.json'))
+    monkeypatch.setattr(m, 'ARCHIVE_FILE', str(tmp_path / 'old_news.json'))
+    monkeypatch.setattr(m, 'SENTENCE_CACHE_FILE', str(tmp_path / 'sentence_cache.json'))
+    feed = ("<rss xmlns:content='http://purl.org/rss/1.0/modules/content/'><channel><title>Test</title><item>"
+            "<title>Wonderful amazing happy news</title><link>https://www.theguardian.com/a</link>"
+            "<description>Teaser text</description>"
+            "<content:encoded>&lt;p&gt;volunteers planted trees by the river.&lt;/p&gt;</content:encoded>"
+            "</item></channel></rss>")
+    monkeypatch.setattr(m, 'fetch_feed_with_retry', lambda url, **k: feedparser.parse(feed))
+    monkeypatch.setattr(m, 'get_first_sentence', lambda *a, **k: None)
+
+    state = m.start_run(m.SentimentIntensityAnalyzer())
+    m.process_feeds(state, [GUARDIAN])
+
+    # Scored under the threshold, so the article was tried; it failed
+    assert state['metrics']['article_fetches_avoided'] == 0
+    assert state['added_stories'][0]['first_sentence'] == 'volunteers planted trees by the river.'
@@ -0,0 +1,66 @@
+import json
+import importlib.util
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+
+def _story(i, day):
+    return {'headline': f'h{i}', 'link': f'l{i}', 'timestamp': f'2026-01-{day:02d}T00:00:00Z', 'source': 'BBC News'}
+
+
+def _point_at(tmp_path):
+    m.DATA_FILE = str(tmp_path / "good_news.json")
+    m.ARCHIVE_FILE = str(tmp_path / "old_news.json")
+    m.METRICS_FILE = str(tmp_path / "metrics.json")
+    m.SENTENCE_CACHE_FILE = str(tmp_path / "sentence_cache.json")
+
+
+def test_seeds_from_json_and_archives_with_update(tmp_path):
+    _point_at(tmp_path)
+    (tmp_path / "good_news.json").write_text(json.dumps({'last run': '2026-01-05T00:00:00Z', 'stories': [_story(2, 2), _story(1, 1)]}))
+    (tmp_path / "old_news.json").write_text(json.dumps([_story(0, 1)]))
+    (tmp_path / "sentence_cache.json").write_text(json.dumps({'l1': 'A sentence.'}))
+
+    conn = m.db_connect(str(tmp_path / "ramah.db"))
+    assert m.db_has_link(conn, 'l0') and m.db_has_link(conn, 'l2')
+    assert 'l1' in m.DbSentenceCache(conn)
+
+    archived = m.db_save_stories(conn, [_story(3, 3), _story(2, 2)], '2026-01-06T00:00:00Z', max_stories=2)
+    assert [s['link'] for s in archived] == ['l1']
+
+    m.db_export(conn)
+    content = json.loads((tmp_path / "good_news.json").read_text())
+    assert content['last run'] == '2026-01-06T00:00:00Z'
+    assert [s['link'] for s in content['stories']] == ['l3', 'l2']
+    assert [s['link'] for s in json.loads((tmp_path / "old_news.json").read_text())] == ['l1', 'l0']
+    conn.close()
+
+
+def test_sentence_cache_writes_are_batched(tmp_path):
+    _point_at(tmp_path)
+    conn = m.db_connect(str(tmp_path / "ramah.db"))
+    cache = m.DbSentenceCache(conn)
+    cache['l9'] = 'Pending sentence.'
+    assert cache['l9'] == 'Pending sentence.'
+
+    m.save_sentence_cache(cache)
+    assert cache.pending == {}
+    assert m.DbSentenceCache(conn)['l9'] == 'Pending sentence.'
+    conn.close()
+
+
+def test_both_backends_treat_archived_links_as_seen(tmp_path, monkeypatch):
+    _point_at(tmp_path)
+    (tmp_path / "good_news.json").write_text(json.dumps({'last run': '2026-01-05T00:00:00Z', 'stories': [_story(1, 2)]}))
+    (tmp_path / "old_news.json").write_text(json.dumps([_story(0, 1)]))
+
+    state = m.start_run(None)
+    assert {'l0', 'l1'} <= state['existing_urls']
+
+    monkeypatch.setattr(m, 'STORAGE_BACKEND', 'sqlite')
+    monkeypatch.setattr(m, 'SQLITE_FILE', str(tmp_path / "ramah.db"))
+    state = m.start_run(None)
+    assert m.db_has_link(state['db'], 'l0') and m.db_has_link(state['db'], 'l1')
+    state['db'].close()
@@ -0,0 +1,55 @@
+import json
+import importlib.util
+
+spec = importlib.util.spec_from_file_location('fetch_news','scripts/fetch_news.py')
+m = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(m)
+
+STORIES = [
+    {'headline':'h1','link':'l1','mean_score':0.5,'timestamp':'2026-01-02T00:00:00Z'},
+    {'headline':'café "quoted"','link':'l2','mean_score':12345,'timestamp':'2026-01-01T00:00:00Z'},
+]
+
+
+def test_iter_stories_both_formats(tmp_path):
+    p = tmp_path / "good_news.json"
+    p.write_text(json.dumps(STORIES, indent=2))
+    assert list(m.iter_stories(str(p), chunk_size=7)) == STORIES
+
+    p.write_text(json.dumps({'last run': '2026-01-03T00:00:00Z', 'stories': STORIES}, indent=2))
+    assert list(m.iter_stories(str(p), chunk_size=7)) == STORIES
+    assert m.load_last_run(str(p)) == '2026-01-03T00:00:00Z'
+
+
+def test_iter_stories_rejects_truncated_file(tmp_path):
+    p = tmp_path / "good_news.json"
+    p.write_text(json.dumps(STORIES, indent=2)[:-10])
+    try:
+        list(m.iter_stories(str(p)))
+    except ValueError:
+        return
+    assert False, "expected ValueError"
+
+
+def test_save_data_stream_matches_save_data(tmp_path):
+    a = tmp_path / "a.json"
+    b = tmp_path / "b.json"
+    for stories, last_run in [(STORIES, None), (STORIES, '2026-01-03T00:00:00Z'), ([], None), ([], 'x')]:
+        m.save_data(stories, str(a), last_run=last_run)
+        m.save_data_stream(iter(stories), str(b), last_run=last_run)
+        assert a.read_text() == b.read_text()
+        a.unlink()
+        b.unlink()
+
+
+def test_save_data_stream_rewrites_in_place(tmp_path):
+    p = tmp_path / "good_news.json"
+    p.write_text(json.dumps({'last run': '2026-01-03T00:00:00Z', 'stories': STORIES}, indent=2))
+
+    kept = (s for s in m.iter_stories(str(p)) if s['link'] != 'l2')
+    assert m.save_data_stream(kept, str(p)) == 1
+
+    content = json.loads(p.read_text())
+    assert content['last run'] == '2026-01-03T00:00:00Z'
+    assert content['stories'] == STORIES[:1]
+    assert not (tmp_path / "good_news.json.tmp").exists()
@@ -0,0 +1,39 @@
+import importlib.util
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+spec = importlib.util.spec_from_file_location('what_if','scripts/what_if.py')
+w = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(w)
+
+
+def _columns():
+    return {
+        'headline': np.array(['a happy day', 'royal wedding joy', 'cricket win'], dtype=str),
+        'link': np.array(['https://a/1', 'https://a/2', 'https://b/3'], dtype=str),
+        'vader': np.array([0.8, 0.6, 0.2]),
+        'textblob': np.array([0.4, 0.2, 0.6]),
+        'source_names': np.array(['A', 'B']),
+        'source_codes': np.array([0, 0, 1]),
+    }
+
+
+def test_evaluate_grid_matches_scalar_rule():
+    variants = [('current', []), ('+royal', ['royal'])]
+    counts, totals = w.evaluate(_columns(), thresholds=[0.3, 0.5], weights=[0.5, 1.0], variants=variants)
+
+    assert counts.shape == (2, 2, 2, 2)
+    assert list(totals) == [2, 1]
+    # Plain mean, threshold 0.3: all three pass (0.6, 0.4, 0.4)
+    assert list(counts[0, 0, 0]) == [2, 1]
+    # Blocking "royal" drops the second story from source A
+    assert list(counts[0, 0, 1]) == [1, 1]
+    # VADER only, threshold 0.5: 0.8 and 0.6 pass, 0.2 does not
+    assert list(counts[1, 1, 0]) == [2, 0]
+
+
+def test_block_variants_include_combined_edit():
+    labels = [label for label, _ in w.block_variants(add=['royal'], remove=['cricket'])]
+    assert labels == ['current', '+royal', '-cricket', 'all edits']